@@ -306,8 +306,9 @@ def fetch_movement_balances(address: str) -> Dict[str, Any]:
         # Get indexer URL (uses default provider: sentio)
         indexer_url = get_indexer_url()
 
-        # Fetch balances with pagination support
-        result = get_balances(indexer_url=indexer_url, address=address)
+        # Fetch balances with pagination support; always fresh, so balances
+        # shown right after a transfer are never served from the cache
+        result = get_balances(indexer_url=indexer_url, address=address, use_cache=False)
 
         # Return in the format expected by the agent
         if result.get("success", False):
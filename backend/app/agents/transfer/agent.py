@@ -72,20 +72,21 @@ NOTES:
 """
 
 import os
-import uuid
-import json
-from typing import Any, List
-
+import re
+import secrets
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, List, Optional
+
+import httpx
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
-from a2a.server.apps import A2AStarletteApplication
 from a2a.server.events import EventQueue
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import (
     AgentCapabilities,
     AgentCard,
@@ -95,14 +96,16 @@ from a2a.types import (
     Role,
     TextPart,
 )
-from google.adk.artifacts import InMemoryArtifactService
-from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
 from langchain.agents import create_agent
 
+# The A2A server app and Google ADK services are imported lazily where they are
+# used, so importing this module (e.g. for a health-check-only startup) does not
+# pay for loading them.
+if TYPE_CHECKING:
+    from a2a.server.apps import A2AStarletteApplication
+
 # Constants
 DEFAULT_MODEL = "gpt-4o-mini"
 DEFAULT_TEMPERATURE = 0
@@ -111,11 +114,32 @@ EMPTY_RESPONSE_MESSAGE = (
     "I apologize, but I couldn't generate a response. Please try rephrasing your question."
 )
 
+# Shared OpenAI HTTP connection pool
+OPENAI_HTTP_TIMEOUT = 30.0
+OPENAI_MAX_CONNECTIONS = 200
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 100
+
 # Environment variables
 ENV_OPENAI_API_KEY = "OPENAI_API_KEY"
 ENV_OPENAI_MODEL = "OPENAI_MODEL"
 ENV_MOVEMENT_RPC_URL = "MOVEMENT_RPC_URL"
 
+
+@dataclass(frozen=True, slots=True)
+class EnvConfig:
+    """Environment configuration, read once at import time."""
+
+    openai_api_key: Optional[str]
+    openai_model: str
+    movement_rpc_url: Optional[str]
+
+
+ENV = EnvConfig(
+    openai_api_key=os.getenv(ENV_OPENAI_API_KEY),
+    openai_model=os.getenv(ENV_OPENAI_MODEL, DEFAULT_MODEL),
+    movement_rpc_url=os.getenv(ENV_MOVEMENT_RPC_URL),
+)
+
 # Message types
 MESSAGE_TYPE_AI = "ai"
 MESSAGE_ROLE_ASSISTANT = "assistant"
@@ -134,9 +158,9 @@ ERROR_TIMEOUT_MESSAGE = "Request timed out. Please try again."
 ERROR_GENERIC_PREFIX = "I encountered an error while processing your request: "
 
 
-def get_system_prompt() -> str:
-    """Get the system prompt for the agent."""
-    return """You are a helpful Web3 assistant specializing in token transfers on Movement Network.
+# The system prompt is kept fully static so that it forms a stable prefix across
+# requests and can be served from OpenAI's automatic prompt cache.
+SYSTEM_PROMPT = """You are a helpful Web3 assistant specializing in token transfers on Movement Network.
 
 CRITICAL: This application works EXCLUSIVELY with Movement Network. All operations default to Movement Network.
 
@@ -172,6 +196,11 @@ Explain that transfers are irreversible once confirmed.
 If there's an error, explain it clearly and suggest alternatives."""
 
 
+def get_system_prompt() -> str:
+    """Get the system prompt for the agent."""
+    return SYSTEM_PROMPT
+
+
 def create_agent_skill() -> AgentSkill:
     """Create the agent skill definition."""
     return AgentSkill(
@@ -189,6 +218,66 @@ def create_agent_skill() -> AgentSkill:
     )
 
 
+# Static card components, built once at import time
+AGENT_SKILL = create_agent_skill()
+AGENT_CAPABILITIES = AgentCapabilities(streaming=True)
+
+
+# Movement Network addresses: "0x" followed by exactly 64 hex characters
+MOVEMENT_ADDRESS_PATTERN = re.compile(r"\A0x[0-9a-fA-F]{64}\Z")
+
+# A bare imperative transfer command and nothing else, e.g.
+# "send 1.5 USDC.e to 0x<64 hex>". Matched against the whole query with
+# fullmatch, so questions, negations, estimates and queries naming a sender
+# fall through to the LLM agent.
+TRANSFER_INTENT_PATTERN = re.compile(
+    r"\s*(?:transfer|send)\s+(\d+(?:\.\d+)?)\s+([A-Za-z][\w.]*)\s+to\s+"
+    r"(0x[0-9a-fA-F]{64})\s*[.!]?\s*",
+    re.IGNORECASE,
+)
+
+# Token symbols the direct command path may transfer (upper-cased). Any other
+# word in the token position ("tokens", "it", an unlisted symbol) is left to
+# the LLM agent.
+FAST_PATH_TOKENS = frozenset({"MOVE", "USDC.E", "USDT.E", "WBTC.E", "WETH.E"})
+
+
+# Tool response templates
+# The tool stubs return fixed-schema JSON, so the payloads are pre-rendered
+# templates and only the dynamic fields are interpolated (after JSON escaping).
+_JSON_ESCAPE_TABLE = str.maketrans(
+    {'"': '\\"', "\\": "\\\\", **{i: f"\\u{i:04x}" for i in range(0x20)}}
+)
+_INVALID_ADDRESS_JSON = (
+    '{"status": "error", '
+    '"error": "Invalid recipient address. Movement Network addresses must be 66 characters and start with 0x.", '
+    '"message": "Please provide a valid Movement Network address (66 characters, starting with 0x)"}'
+)
+_EXECUTE_TRANSFER_TPL = (
+    '{{"status": "initiated", "token": "{token}", "amount": "{amount}", '
+    '"from_address": "{from_address}", "to_address": "{to_address}", '
+    '"tx_hash": "0x1234567890abcdef...", "estimated_time": "30-60 seconds", '
+    '"network": "movement", '
+    '"message": "Transfer transaction initiated: {amount} {token} -> {to_short}...{to_tail}"}}'
+)
+_TRANSFER_STATUS_TPL = (
+    '{{"tx_hash": "{tx_hash}", "status": "completed", "confirmations": "12/12", '
+    '"token": "MOVE", "amount": "1", "from_address": "0x...", "to_address": "0x...", '
+    '"message": "Transfer transaction completed successfully"}}'
+)
+_ESTIMATE_FEES_TPL = (
+    '{{"token": "{token}", "amount": "{amount}", "to_address": "{to_address}", '
+    '"network_fee": "0.001 MOVE", "total_cost": "{total_cost} {token}", '
+    '"estimated_time": "30-60 seconds", '
+    '"message": "Estimated fees for transferring {amount} {token}"}}'
+)
+
+
+def _escape_json(value: str) -> str:
+    """Escape a string for interpolation inside a JSON string literal."""
+    return value.translate(_JSON_ESCAPE_TABLE)
+
+
 @tool
 def execute_transfer(
     token: str,
@@ -210,28 +299,17 @@ def execute_transfer(
         Transfer transaction details as a string
     """
     # Validate address format
-    if not to_address.startswith("0x") or len(to_address) != 66:
-        return json.dumps(
-            {
-                "status": "error",
-                "error": "Invalid recipient address. Movement Network addresses must be 66 characters and start with 0x.",
-                "message": "Please provide a valid Movement Network address (66 characters, starting with 0x)",
-            }
-        )
+    if not MOVEMENT_ADDRESS_PATTERN.match(to_address):
+        return _INVALID_ADDRESS_JSON
 
     # TODO: Implement actual transfer execution via Movement Network smart contracts
-    return json.dumps(
-        {
-            "status": "initiated",
-            "token": token.upper() if token else "MOVE",
-            "amount": amount,
-            "from_address": from_address or "connected_wallet",
-            "to_address": to_address,
-            "tx_hash": "0x1234567890abcdef...",
-            "estimated_time": "30-60 seconds",
-            "network": "movement",
-            "message": f"Transfer transaction initiated: {amount} {token.upper() if token else 'MOVE'} -> {to_address[:10]}...{to_address[-8:]}",
-        }
+    return _EXECUTE_TRANSFER_TPL.format(
+        token=_escape_json(token.upper() if token else "MOVE"),
+        amount=_escape_json(amount),
+        from_address=_escape_json(from_address or "connected_wallet"),
+        to_address=_escape_json(to_address),
+        to_short=_escape_json(to_address[:10]),
+        to_tail=_escape_json(to_address[-8:]),
     )
 
 
@@ -246,18 +324,7 @@ def check_transfer_status(tx_hash: str) -> str:
         Transfer transaction status as a string
     """
     # TODO: Implement actual transaction status checking
-    return json.dumps(
-        {
-            "tx_hash": tx_hash,
-            "status": "completed",
-            "confirmations": "12/12",
-            "token": "MOVE",
-            "amount": "1",
-            "from_address": "0x...",
-            "to_address": "0x...",
-            "message": "Transfer transaction completed successfully",
-        }
-    )
+    return _TRANSFER_STATUS_TPL.format(tx_hash=_escape_json(tx_hash))
 
 
 @tool
@@ -277,28 +344,27 @@ def estimate_transfer_fees(
         Fee estimates as a string
     """
     # TODO: Implement actual fee calculation
-    return json.dumps(
-        {
-            "token": token.upper() if token else "MOVE",
-            "amount": amount,
-            "to_address": to_address,
-            "network_fee": "0.001 MOVE",
-            "total_cost": f"{float(amount) + 0.001} {token.upper() if token else 'MOVE'}",
-            "estimated_time": "30-60 seconds",
-            "message": f"Estimated fees for transferring {amount} {token.upper() if token else 'MOVE'}",
-        }
+    return _ESTIMATE_FEES_TPL.format(
+        token=_escape_json(token.upper() if token else "MOVE"),
+        amount=_escape_json(amount),
+        to_address=_escape_json(to_address),
+        total_cost=float(amount) + 0.001,
     )
 
 
+# Tool instances (and their args schemas, built by @tool at decoration time)
+# are created once at import and shared by every agent build.
+TOOLS: List[Any] = [execute_transfer, check_transfer_status, estimate_transfer_fees]
+
+
 def get_tools() -> List[Any]:
     """Get the list of tools available to the agent."""
-    return [execute_transfer, check_transfer_status, estimate_transfer_fees]
+    return TOOLS
 
 
 def validate_openai_api_key() -> None:
     """Validate that OpenAI API key is set."""
-    openai_api_key = os.getenv(ENV_OPENAI_API_KEY)
-    if not openai_api_key:
+    if not ENV.openai_api_key:
         raise ValueError(
             "OPENAI_API_KEY environment variable is required.\n"
             "Please set it before running the agent:\n"
@@ -307,34 +373,71 @@ def validate_openai_api_key() -> None:
         )
 
 
+# One HTTP/2 client shared by every ChatOpenAI instance so concurrent requests
+# reuse keep-alive connections instead of each model opening its own pool. The
+# application lifespan opens it on the serving event loop and closes it on
+# shutdown; when it is not open, ChatOpenAI falls back to its own client.
+_openai_http_client: Optional[httpx.AsyncClient] = None
+
+
+def open_openai_http_client() -> httpx.AsyncClient:
+    """Create the shared OpenAI HTTP client, if it is not already open."""
+    global _openai_http_client
+    if _openai_http_client is None:
+        _openai_http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=OPENAI_HTTP_TIMEOUT,
+        )
+    return _openai_http_client
+
+
+async def close_openai_http_client() -> None:
+    """Close the shared OpenAI HTTP client, if it is open."""
+    global _openai_http_client
+    client, _openai_http_client = _openai_http_client, None
+    if client is not None:
+        await client.aclose()
+
+
 def create_chat_model() -> ChatOpenAI:
     """Create and configure the ChatOpenAI model."""
-    model_name = os.getenv(ENV_OPENAI_MODEL, DEFAULT_MODEL)
-    return ChatOpenAI(model=model_name, temperature=DEFAULT_TEMPERATURE)
+    return ChatOpenAI(
+        model=ENV.openai_model,
+        temperature=DEFAULT_TEMPERATURE,
+        http_async_client=_openai_http_client,
+    )
 
 
 def is_assistant_message(message: Any) -> bool:
     """Check if a message is from the assistant."""
-    if hasattr(message, MESSAGE_KEY_TYPE) and hasattr(message, MESSAGE_KEY_CONTENT):
-        return (
-            message.type == MESSAGE_TYPE_AI
-            or getattr(message, MESSAGE_KEY_ROLE, None) == MESSAGE_ROLE_ASSISTANT
-        )
-    if isinstance(message, dict):
-        return (
-            message.get(MESSAGE_KEY_ROLE) == MESSAGE_ROLE_ASSISTANT
-            or message.get(MESSAGE_KEY_TYPE) == MESSAGE_TYPE_AI
-        )
-    return False
+    try:
+        message_type = message.type
+        message.content
+    except AttributeError:
+        if isinstance(message, dict):
+            return (
+                message.get(MESSAGE_KEY_ROLE) == MESSAGE_ROLE_ASSISTANT
+                or message.get(MESSAGE_KEY_TYPE) == MESSAGE_TYPE_AI
+            )
+        return False
+    return (
+        message_type == MESSAGE_TYPE_AI
+        or getattr(message, MESSAGE_KEY_ROLE, None) == MESSAGE_ROLE_ASSISTANT
+    )
 
 
 def extract_message_content(message: Any) -> str:
     """Extract content from a message object."""
-    if hasattr(message, MESSAGE_KEY_CONTENT):
+    try:
         return message.content
-    if isinstance(message, dict):
-        return message.get(MESSAGE_KEY_CONTENT, "")
-    return ""
+    except AttributeError:
+        if isinstance(message, dict):
+            return message.get(MESSAGE_KEY_CONTENT, "")
+        return ""
 
 
 def extract_assistant_response(result: Any) -> str:
@@ -385,8 +488,67 @@ def format_error_message(error: Exception) -> str:
     return f"{ERROR_GENERIC_PREFIX}{error}. Please try again."
 
 
+def build_response_json(response: str, success: bool = True, error: Optional[str] = None) -> str:
+    """Serialize the {response, success[, error]} envelope returned by invoke.
+
+    The envelope is a plain dict literal encoded with orjson; it never goes
+    through pydantic validation.
+    """
+    if error is None:
+        return orjson.dumps({"response": response, "success": success}).decode()
+    return orjson.dumps({"response": response, "success": success, "error": error}).decode()
+
+
+# Pre-rendered envelopes for the well-known failure modes
+AUTH_ERROR_JSON = build_response_json(ERROR_AUTH_MESSAGE, success=False, error="auth")
+TIMEOUT_ERROR_JSON = build_response_json(ERROR_TIMEOUT_MESSAGE, success=False, error="timeout")
+
+
+def run_transfer_fast_path(query: str) -> Optional[str]:
+    """Handle a bare "transfer/send X TOKEN to 0x..." command directly.
+
+    Only a query consisting of exactly that command, naming a token in
+    FAST_PATH_TOKENS, is handled; anything else (a question, a negation, an
+    estimate request, an explicit sender, an unknown symbol) goes to the LLM
+    agent. A command of this shape always resolves to
+    estimate_transfer_fees followed by execute_transfer with the same
+    arguments, so the tools are called in order without an LLM round-trip.
+
+    Args:
+        query: The raw user query
+
+    Returns:
+        The assembled response text, or None if the query does not match and
+        should be handled by the LLM agent
+    """
+    match = TRANSFER_INTENT_PATTERN.fullmatch(query)
+    if not match:
+        return None
+    amount, token, to_address = match.groups()
+    if token.upper() not in FAST_PATH_TOKENS:
+        return None
+    tool_args = {"token": token, "amount": amount, "to_address": to_address}
+    fees = orjson.loads(estimate_transfer_fees.invoke(tool_args))
+    transfer = orjson.loads(execute_transfer.invoke(tool_args))
+    if transfer.get("status") == "error":
+        return transfer["message"]
+    return (
+        f"{fees['message']}: network fee {fees['network_fee']}, "
+        f"total cost {fees['total_cost']}.\n"
+        f"{transfer['message']}\n"
+        f"Transaction hash: {transfer['tx_hash']} "
+        f"(estimated confirmation time: {transfer['estimated_time']}).\n"
+        "Note: transfers are irreversible once confirmed."
+    )
+
+
 class TransferAgent:
     def __init__(self):
+        from google.adk.artifacts import InMemoryArtifactService
+        from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+        from google.adk.runners import Runner
+        from google.adk.sessions import InMemorySessionService
+
         self._agent = self._build_agent()
         self._runner = Runner(
             app_name="transferagent",
@@ -411,16 +573,24 @@ class TransferAgent:
     async def invoke(self, query: str, session_id: str) -> str:
         """Invoke the agent with a query."""
         try:
+            fast_path_output = run_transfer_fast_path(query)
+            if fast_path_output is not None:
+                return build_response_json(fast_path_output)
             result = await self._invoke_agent(query, session_id)
             output = extract_assistant_response(result)
             validated_output = self._validate_output(output)
             # Return as JSON string to ensure compatibility with ADK agent expectations
-            return json.dumps({"response": validated_output, "success": True})
+            return build_response_json(validated_output)
         except Exception as e:
             print(f"Error in agent invoke: {e}")
-            error_message = format_error_message(e)
+            error_text = str(e)
+            error_lower = error_text.lower()
+            if ERROR_API_KEY in error_lower:
+                return AUTH_ERROR_JSON
+            if ERROR_TIMEOUT in error_lower:
+                return TIMEOUT_ERROR_JSON
             # Return error as JSON string
-            return json.dumps({"response": error_message, "success": False, "error": str(e)})
+            return build_response_json(format_error_message(e), success=False, error=error_text)
 
     async def _invoke_agent(self, query: str, session_id: str) -> Any:
         """Invoke the agent with the given query and session."""
@@ -448,7 +618,7 @@ def get_session_id(context: RequestContext) -> str:
 def create_message(content: str) -> Message:
     """Create a message object with the given content."""
     return Message(
-        message_id=str(uuid.uuid4()),
+        message_id=secrets.token_hex(16),
         role=Role.agent,
         parts=[Part(root=TextPart(kind="text", text=content))],
     )
@@ -479,16 +649,14 @@ class TransferAgentExecutor(AgentExecutor):
         raise NotImplementedError("cancel not supported")
 
 
-def create_transfer_agent_app(card_url: str) -> A2AStarletteApplication:
-    """Create and configure the A2A server application for the transfer agent.
-
-    Args:
-        card_url: The base URL where the agent card will be accessible
+@lru_cache(maxsize=8)
+def create_agent_card(card_url: str) -> AgentCard:
+    """Create the public agent card.
 
-    Returns:
-        A2AStarletteApplication instance configured for the transfer agent
+    Cards are cached per card_url so repeated app construction (e.g. during
+    dev hot-reload) reuses the validated model.
     """
-    agent_card = AgentCard(
+    return AgentCard(
         name="transfer",
         description=(
             "LangGraph powered agent that helps transfer tokens "
@@ -498,10 +666,26 @@ def create_transfer_agent_app(card_url: str) -> A2AStarletteApplication:
         version="1.0.0",
         default_input_modes=["text"],
         default_output_modes=["text"],
-        capabilities=AgentCapabilities(streaming=True),
-        skills=[create_agent_skill()],
+        capabilities=AGENT_CAPABILITIES,
+        skills=[AGENT_SKILL],
         supports_authenticated_extended_card=False,
     )
+
+
+def create_transfer_agent_app(card_url: str) -> "A2AStarletteApplication":
+    """Create and configure the A2A server application for the transfer agent.
+
+    Args:
+        card_url: The base URL where the agent card will be accessible
+
+    Returns:
+        A2AStarletteApplication instance configured for the transfer agent
+    """
+    from a2a.server.apps import A2AStarletteApplication
+    from a2a.server.request_handlers import DefaultRequestHandler
+    from a2a.server.tasks import InMemoryTaskStore
+
+    agent_card = create_agent_card(card_url)
     request_handler = DefaultRequestHandler(
         agent_executor=TransferAgentExecutor(),
         task_store=InMemoryTaskStore(),
@@ -5,16 +5,22 @@ This module creates and configures the main FastAPI application, registers
 agent applications, and sets up middleware and health check endpoints.
 """
 
+import asyncio
 import os
 import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-# Load environment variables from .env file
+# Load environment variables from .env file. Must run before the first
+# get_base_url() call, which caches its result.
 load_dotenv()
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+import orjson
 
 from app.agents.balance.agent import create_balance_agent_app
 from app.agents.bridge.agent import create_bridge_agent_app
@@ -26,25 +32,137 @@ from app.agents.orchestrator.agent import create_orchestrator_agent_app
 from app.agents.premium_lending.agent import create_lending_agent_app as create_premium_lending_agent_app
 from app.agents.sentiment.agent import create_sentiment_agent_app
 from app.agents.swap.agent import create_swap_agent_app
-from app.agents.transfer.agent import create_transfer_agent_app
+from app.agents.transfer.agent import (
+    close_openai_http_client,
+    create_transfer_agent_app,
+    open_openai_http_client,
+)
 from app.facilitator.routes import router as facilitator_router
+from app.middleware import FastCORS, HealthASGIApp, LazyAgentMount
 
 # Configuration constants
 DEFAULT_AGENTS_PORT = 8000
 API_VERSION = "0.1.0"
 SERVICE_NAME = "backend-api"
 
+# Health check response body, serialized once at import
+HEALTH_RESPONSE_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": SERVICE_NAME,
+        "version": API_VERSION,
+    }
+)
+
+# Environment variables an agent app needs to build. Each entry is a group of
+# alternative names, at least one of which must be set.
+REQUIRED_ENV_OPENAI: Tuple[Tuple[str, ...], ...] = (("OPENAI_API_KEY",),)
+REQUIRED_ENV_PAYWALL: Tuple[Tuple[str, ...], ...] = (
+    ("MOVEMENT_PAY_TO", "NEXT_PUBLIC_MOVEMENT_PAY_TO"),
+)
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """A mounted agent: its app factory, /agents metadata and required env."""
+
+    name: str
+    protocol: str
+    description: str
+    factory: Callable[..., Any]
+    required_env: Tuple[Tuple[str, ...], ...] = ()
+
+
+# Every mounted agent by mount path. /agents is served from this metadata, so
+# listing agents never instantiates them. A2A factories are built with their
+# card URL; the AG-UI orchestrator factory takes no arguments.
+AGENT_REGISTRY: Dict[str, AgentSpec] = {
+    "/balance": AgentSpec(
+        name="balance",
+        protocol="a2a",
+        description="Token balances for wallets on Movement Network",
+        factory=create_balance_agent_app,
+        required_env=REQUIRED_ENV_OPENAI,
+    ),
+    "/bridge": AgentSpec(
+        name="bridge",
+        protocol="a2a",
+        description="Bridge assets between chains using Movement Bridge",
+        factory=create_bridge_agent_app,
+        required_env=REQUIRED_ENV_OPENAI,
+    ),
+    # Unified lending agent, also served on /lending_comparison for backward compatibility
+    "/lending": AgentSpec(
+        name="lending",
+        protocol="a2a",
+        description="Compare rates and execute lending operations on MovePosition and Echelon",
+        factory=create_lending_agent_app,
+        required_env=REQUIRED_ENV_OPENAI,
+    ),
+    "/lending_comparison": AgentSpec(
+        name="lending",
+        protocol="a2a",
+        description="Backward-compatible route for the unified lending agent",
+        factory=create_lending_comparison_agent_app,
+        required_env=REQUIRED_ENV_OPENAI,
+    ),
+    "/swap": AgentSpec(
+        name="swap",
+        protocol="a2a",
+        description="Swap tokens on Movement Network using decentralized exchanges",
+        factory=create_swap_agent_app,
+        required_env=REQUIRED_ENV_OPENAI,
+    ),
+    "/transfer": AgentSpec(
+        name="transfer",
+        protocol="a2a",
+        description="Transfer tokens on Movement Network between addresses",
+        factory=create_transfer_agent_app,
+        required_env=REQUIRED_ENV_OPENAI,
+    ),
+    "/orchestrator": AgentSpec(
+        name="orchestrator",
+        protocol="ag-ui",
+        description="Web3 orchestrator that routes requests to the other agents",
+        factory=create_orchestrator_agent_app,
+    ),
+    "/premium_lending_agent": AgentSpec(
+        name="premium_lending_agent",
+        protocol="a2a",
+        description="Premium lending agent for MovePosition and Echelon",
+        factory=create_premium_lending_agent_app,
+        required_env=REQUIRED_ENV_OPENAI + REQUIRED_ENV_PAYWALL,
+    ),
+    "/sentiment": AgentSpec(
+        name="sentiment",
+        protocol="a2a",
+        description="Cryptocurrency sentiment analysis and trading recommendations",
+        factory=create_sentiment_agent_app,
+        required_env=REQUIRED_ENV_PAYWALL,
+    ),
+}
+
+AGENT_LIST: List[Dict[str, str]] = [
+    {"path": path, "name": spec.name, "protocol": spec.protocol, "description": spec.description}
+    for path, spec in AGENT_REGISTRY.items()
+]
+
 # Environment variable keys
 ENV_AGENTS_PORT = "AGENTS_PORT"
 ENV_RENDER_EXTERNAL_URL = "RENDER_EXTERNAL_URL"
+ENV_AGENTS_EAGER_INIT = "AGENTS_EAGER_INIT"
 
 
+@lru_cache(maxsize=1)
 def get_base_url() -> str:
     """Get the base URL for agent card endpoints.
 
     Checks for Railway deployment first (RAILWAY_PUBLIC_DOMAIN), then Render (RENDER_EXTERNAL_URL),
     then falls back to localhost for local development.
 
+    The result is cached; environment variables are read on the first call only
+    (after load_dotenv() at import). Call get_base_url.cache_clear() to re-read them.
+
     Returns:
         Base URL from environment or constructed from port
     """
@@ -71,62 +189,77 @@ def get_base_url() -> str:
     return base_url
 
 
-def register_agents(app: FastAPI) -> None:
-    """Register all agent applications with the main FastAPI app.
+def build_a2a_agent_app(factory: Callable[..., Any], card_url: str) -> Any:
+    """Build an A2A agent app from its factory.
 
     Args:
-        app: The FastAPI application instance to mount agents on
-    """
-    base_url = get_base_url()
+        factory: create_*_agent_app function for the agent
+        card_url: Public URL of the agent card
 
-    # Balance Agent (A2A Protocol)
-    # CRITICAL: Add trailing slash to card_url to avoid 307 redirect (POST -> GET conversion)
-    balance_agent_app = create_balance_agent_app(card_url=f"{base_url}/balance/")
-    app.mount("/balance", balance_agent_app.build())
+    Returns:
+        The built Starlette application
+    """
+    return factory(card_url=card_url).build()
 
-    # Bridge Agent (A2A Protocol)
-    # CRITICAL: Add trailing slash to card_url to avoid 307 redirect (POST -> GET conversion)
-    bridge_agent_app = create_bridge_agent_app(card_url=f"{base_url}/bridge/")
-    app.mount("/bridge", bridge_agent_app.build())
 
-    # Unified Lending Agent (A2A Protocol) - Combines comparison and operations
-    # Both endpoints point to the same unified agent for backward compatibility
-    # CRITICAL: Add trailing slash to card_url to avoid 307 redirect (POST -> GET conversion)
-    lending_agent_app = create_lending_agent_app(card_url=f"{base_url}/lending/")
-    app.mount("/lending", lending_agent_app.build())
+def find_missing_agent_env() -> List[str]:
+    """List the required agent environment variables that are not set.
 
-    # Lending Comparison endpoint (same unified agent, different route for backward compatibility)
-    # CRITICAL: Add trailing slash to card_url to avoid 307 redirect (POST -> GET conversion)
-    lending_comparison_agent_app = create_lending_comparison_agent_app(
-        card_url=f"{base_url}/lending_comparison/"
-    )
-    app.mount("/lending_comparison", lending_comparison_agent_app.build())
+    Returns:
+        One "NAME (required by /path)" entry per unset requirement
+    """
+    missing = []
+    for path, spec in AGENT_REGISTRY.items():
+        for names in spec.required_env:
+            if not any(os.getenv(name) for name in names):
+                missing.append(f"{' or '.join(names)} (required by {path})")
+    return missing
 
-    # Swap Agent (A2A Protocol)
-    # CRITICAL: Add trailing slash to card_url to avoid 307 redirect (POST -> GET conversion)
-    swap_agent_app = create_swap_agent_app(card_url=f"{base_url}/swap/")
-    app.mount("/swap", swap_agent_app.build())
 
-    # Transfer Agent (A2A Protocol)
-    # CRITICAL: Add trailing slash to card_url to avoid 307 redirect (POST -> GET conversion)
-    transfer_agent_app = create_transfer_agent_app(card_url=f"{base_url}/transfer/")
-    app.mount("/transfer", transfer_agent_app.build())
+def register_agents(app: FastAPI) -> None:
+    """Register all agent applications with the main FastAPI app.
 
-    # Orchestrator Agent (AG-UI ADK Protocol)
-    orchestrator_agent_app = create_orchestrator_agent_app()
-    app.mount("/orchestrator", orchestrator_agent_app)
+    Agent apps are mounted behind LazyAgentMount, so each one is only built
+    when its route receives its first request.
 
-    # Premium Lending Agent (A2A Protocol)
-    # CRITICAL: Add trailing slash to card_url to avoid 307 redirect (POST -> GET conversion)
-    premium_lending_agent_app = create_premium_lending_agent_app(
-        card_url=f"{base_url}/premium_lending_agent/"
-    )
-    app.mount("/premium_lending_agent", premium_lending_agent_app.build())
+    Args:
+        app: The FastAPI application instance to mount agents on
+    """
+    base_url = get_base_url()
 
-    # Sentiment Agent (A2A Protocol)
     # CRITICAL: Add trailing slash to card_url to avoid 307 redirect (POST -> GET conversion)
-    sentiment_agent_app = create_sentiment_agent_app(card_url=f"{base_url}/sentiment/")
-    app.mount("/sentiment", sentiment_agent_app.build())
+    agent_mounts: List[LazyAgentMount] = []
+    for path, spec in AGENT_REGISTRY.items():
+        if spec.protocol == "a2a":
+            factory = partial(build_a2a_agent_app, spec.factory, f"{base_url}{path}/")
+        else:
+            factory = spec.factory
+        mount = LazyAgentMount(factory, name=path)
+        app.mount(path, mount)
+        agent_mounts.append(mount)
+    app.state.agent_mounts = agent_mounts
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application lifespan.
+
+    Fails startup when an agent's required environment variables are missing,
+    rather than on that agent's first request. Opens the shared OpenAI HTTP
+    client on the serving event loop and closes it on shutdown. When
+    AGENTS_EAGER_INIT is enabled, every agent app is built at startup,
+    concurrently in worker threads, instead of on its first request.
+    """
+    missing = find_missing_agent_env()
+    if missing:
+        raise ValueError("Missing required environment variables:\n  " + "\n  ".join(missing))
+    open_openai_http_client()
+    try:
+        if os.getenv(ENV_AGENTS_EAGER_INIT, "").lower() in ("1", "true", "yes"):
+            await asyncio.gather(*(mount.warm() for mount in app.state.agent_mounts))
+        yield
+    finally:
+        await close_openai_http_client()
 
 
 def create_app() -> FastAPI:
@@ -139,28 +272,22 @@ def create_app() -> FastAPI:
         title="Backend API",
         description="Backend server with FastAPI",
         version=API_VERSION,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
-    # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # Health check endpoint for monitoring and load balancers. Added before CORS
+    # so it sits directly inside it: probes get CORS headers but skip the router.
+    app.add_middleware(HealthASGIApp, body=HEALTH_RESPONSE_BODY)
+
+    # Add CORS middleware (wildcard origins/methods/headers with credentials)
+    app.add_middleware(FastCORS)
 
-    # Register health check endpoint
-    @app.get("/health")
-    async def health_check() -> JSONResponse:
-        """Health check endpoint for monitoring and load balancers."""
-        return JSONResponse(
-            content={
-                "status": "healthy",
-                "service": SERVICE_NAME,
-                "version": API_VERSION,
-            }
-        )
+    # Register agent listing endpoint (served from metadata, no agent is built)
+    @app.get("/agents")
+    async def list_agents() -> List[Dict[str, str]]:
+        """List the mounted agents and their routes."""
+        return AGENT_LIST
 
     # Register facilitator routes (x402 payment protocol)
     app.include_router(facilitator_router)
@@ -0,0 +1,10 @@
+"""
+ASGI middleware used by the main FastAPI application.
+"""
+
+from app.middleware.base import ASGIMiddleware
+from app.middleware.cors_asgi import FastCORS
+from app.middleware.health_asgi import HealthASGIApp
+from app.middleware.lazy_mount import LazyAgentMount
+
+__all__ = ["ASGIMiddleware", "FastCORS", "HealthASGIApp", "LazyAgentMount"]
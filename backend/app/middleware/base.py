@@ -0,0 +1,56 @@
+"""
+Base class for pure-ASGI middleware.
+
+Starlette's BaseHTTPMiddleware (and ``@app.middleware("http")``, which is built
+on it) streams every response body through an anyio memory channel, which costs
+throughput on every request. Middleware in this backend subclasses
+ASGIMiddleware instead and works on the raw ASGI ``scope``/``receive``/``send``
+triple. Use of BaseHTTPMiddleware is rejected by the ruff configuration.
+
+Example:
+    class RequestTimingMiddleware(ASGIMiddleware):
+        async def handle_http(self, scope, receive, send):
+            start = time.perf_counter()
+
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    elapsed = f"{time.perf_counter() - start:.6f}".encode()
+                    message["headers"] = [*message["headers"], (b"x-process-time", elapsed)]
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ASGIMiddleware:
+    """Pure-ASGI middleware that only intercepts HTTP requests.
+
+    Non-HTTP scopes (lifespan, websocket) are passed straight through to the
+    wrapped app. Subclasses override ``handle_http``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await self.handle_http(scope, receive, send)
+
+    async def handle_http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an HTTP request. The default implementation delegates unchanged.
+
+        Args:
+            scope: ASGI connection scope (``scope["type"] == "http"``)
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        await self.app(scope, receive, send)
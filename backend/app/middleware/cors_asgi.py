@@ -0,0 +1,141 @@
+"""
+Pure-ASGI CORS middleware.
+
+FastCORS implements the wildcard CORS policy used by the backend (any origin,
+method and header, with credentials) without going through Starlette's
+CORSMiddleware. Header values are encoded once at construction, preflight
+requests are answered directly without entering the wrapped app, and simple
+responses only get the CORS headers appended to ``http.response.start``.
+
+The behaviour mirrors ``CORSMiddleware(allow_origins=["*"], allow_methods=["*"],
+allow_headers=["*"], allow_credentials=True)``: because browsers reject a
+literal ``*`` when credentials are allowed, preflights echo the request origin
+and requested headers, and simple responses echo the origin when the request
+carries cookies.
+"""
+
+from typing import List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.base import ASGIMiddleware
+
+ALLOWED_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+PREFLIGHT_MAX_AGE = 600
+
+HEADER_ORIGIN = b"origin"
+HEADER_COOKIE = b"cookie"
+HEADER_VARY = b"vary"
+HEADER_REQUEST_METHOD = b"access-control-request-method"
+HEADER_REQUEST_HEADERS = b"access-control-request-headers"
+HEADER_ALLOW_ORIGIN = b"access-control-allow-origin"
+HEADER_ALLOW_CREDENTIALS = b"access-control-allow-credentials"
+HEADER_ALLOW_METHODS = b"access-control-allow-methods"
+HEADER_ALLOW_HEADERS = b"access-control-allow-headers"
+HEADER_MAX_AGE = b"access-control-max-age"
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class FastCORS(ASGIMiddleware):
+    """Wildcard CORS middleware implemented directly on the ASGI interface."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        super().__init__(app)
+        self._allow_origin = b"*"
+        self._allow_methods = ", ".join(ALLOWED_METHODS).encode()
+        self._allow_methods_set = frozenset(method.encode() for method in ALLOWED_METHODS)
+        self._allow_credentials = b"true"
+        self._origin_vary = b"Origin"
+        # Static part of every preflight response; only the echoed origin and
+        # requested headers are added per request.
+        self._preflight_body = b"OK"
+        self._preflight_headers: Headers = [
+            (HEADER_VARY, self._origin_vary),
+            (HEADER_ALLOW_METHODS, self._allow_methods),
+            (HEADER_MAX_AGE, str(PREFLIGHT_MAX_AGE).encode()),
+            (HEADER_ALLOW_CREDENTIALS, self._allow_credentials),
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(self._preflight_body)).encode()),
+        ]
+
+    async def handle_http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        origin = None
+        request_method = None
+        request_headers = None
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == HEADER_ORIGIN:
+                origin = value
+            elif name == HEADER_REQUEST_METHOD:
+                request_method = value
+            elif name == HEADER_REQUEST_HEADERS:
+                request_headers = value
+            elif name == HEADER_COOKIE:
+                has_cookie = True
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._send_preflight(send, origin, request_method, request_headers)
+            return
+
+        await self.app(scope, receive, self._wrap_send(send, origin, has_cookie))
+
+    async def _send_preflight(
+        self,
+        send: Send,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: Optional[bytes],
+    ) -> None:
+        if request_method not in self._allow_methods_set:
+            body = b"Disallowed CORS method"
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 400,
+                    "headers": [
+                        (b"content-type", b"text/plain; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = [*self._preflight_headers, (HEADER_ALLOW_ORIGIN, origin)]
+        if request_headers is not None:
+            headers.append((HEADER_ALLOW_HEADERS, request_headers))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": self._preflight_body})
+
+    def _wrap_send(self, send: Send, origin: bytes, has_cookie: bool) -> Send:
+        # With credentials allowed, a request carrying cookies must get its
+        # origin echoed back instead of "*".
+        allow_origin = origin if has_cookie else self._allow_origin
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers: Headers = []
+                vary = None
+                for name, value in message.get("headers", ()):
+                    lowered = name.lower()
+                    if lowered in (HEADER_ALLOW_ORIGIN, HEADER_ALLOW_CREDENTIALS):
+                        continue
+                    if lowered == HEADER_VARY:
+                        vary = value
+                        continue
+                    headers.append((name, value))
+                headers.append((HEADER_ALLOW_ORIGIN, allow_origin))
+                headers.append((HEADER_ALLOW_CREDENTIALS, self._allow_credentials))
+                if has_cookie:
+                    vary = self._origin_vary if vary is None else vary + b", " + self._origin_vary
+                if vary is not None:
+                    headers.append((HEADER_VARY, vary))
+                message["headers"] = headers
+            await send(message)
+
+        return send_with_cors
@@ -0,0 +1,45 @@
+"""
+Pure-ASGI health check endpoint.
+
+HealthASGIApp answers ``GET``/``HEAD /health`` with a response body serialized
+once at startup and delegates every other request to the wrapped app. Installed
+directly inside CORS handling, health probes still get CORS headers but never
+reach the router.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.middleware.base import ASGIMiddleware
+
+HEALTH_PATH = "/health"
+HEALTH_METHODS = frozenset({"GET", "HEAD"})
+
+
+class HealthASGIApp(ASGIMiddleware):
+    """Serve a prebuilt JSON health response ahead of the wrapped app."""
+
+    def __init__(self, app: ASGIApp, body: bytes, path: str = HEALTH_PATH) -> None:
+        """Initialize the health check wrapper.
+
+        Args:
+            app: The ASGI application to delegate other requests to
+            body: Pre-serialized JSON body returned for health checks
+            path: Path the health check is served on
+        """
+        super().__init__(app)
+        self.path = path
+        self._body = body
+        self._headers = (
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        )
+
+    async def handle_http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        method = scope["method"]
+        if scope["path"] != self.path or method not in HEALTH_METHODS:
+            await self.app(scope, receive, send)
+            return
+        # Messages are built per request: outer middleware (CORS) rewrites
+        # the headers of the start message in place.
+        await send({"type": "http.response.start", "status": 200, "headers": list(self._headers)})
+        await send({"type": "http.response.body", "body": b"" if method == "HEAD" else self._body})
@@ -0,0 +1,69 @@
+"""
+Lazily constructed ASGI sub-applications.
+
+LazyAgentMount wraps an agent app factory and defers calling it until the
+first request reaches the mount, so startup does not pay for building agent
+apps (A2A cards, executors, LLM clients) that are never used.
+"""
+
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class LazyAgentMount:
+    """ASGI app that builds the wrapped agent app on first use."""
+
+    def __init__(self, factory: Callable[[], ASGIApp], name: str = "agent") -> None:
+        """Initialize the lazy mount.
+
+        Args:
+            factory: Zero-argument callable returning the ASGI app to serve
+            name: Label used when logging build failures (e.g. the mount path)
+        """
+        self._factory = factory
+        self.name = name
+        self._app: Optional[ASGIApp] = None
+        self._error: Optional[Exception] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the wrapped app has been constructed."""
+        return self._app is not None
+
+    async def get_app(self) -> ASGIApp:
+        """Return the wrapped app, building it exactly once.
+
+        The factory runs in a worker thread, so a slow build does not block
+        other requests on the event loop. A failed build is logged once and
+        not retried; later requests fail with the same cause.
+        """
+        if self._app is None:
+            async with self._lock:
+                if self._error is not None:
+                    raise RuntimeError(f"{self.name} app failed to build") from self._error
+                if self._app is None:
+                    try:
+                        self._app = await asyncio.to_thread(self._factory)
+                    except Exception as e:
+                        logger.exception("Failed to build %s app", self.name)
+                        self._error = e
+                        raise
+        return self._app
+
+    async def warm(self) -> None:
+        """Build the wrapped app ahead of the first request.
+
+        Several mounts can be warmed concurrently, since each build runs in
+        its own worker thread.
+        """
+        await self.get_app()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        app = self._app if self._app is not None else await self.get_app()
+        await app(scope, receive, send)
@@ -8,15 +8,15 @@ with blockchain-based micropayments on Movement Network.
 import base64
 import json
 import os
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Optional
 
 from dotenv import load_dotenv
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.types import Message, Receive, Scope, Send
 
 from app.facilitator.service import FacilitatorService
+from app.middleware.base import ASGIMiddleware
 from app.x402.types import RouteConfig, RoutesMap, PaymentRequirements
 
 load_dotenv()
@@ -86,7 +86,7 @@ def to_payment_requirements(
     )
 
 
-class X402PaywallMiddleware(BaseHTTPMiddleware):
+class X402PaywallMiddleware(ASGIMiddleware):
     """Middleware for x402 payment protocol protection.
 
     This middleware protects routes by requiring payment before allowing access.
@@ -210,16 +210,18 @@ class X402PaywallMiddleware(BaseHTTPMiddleware):
             body["error"] = error
         return JSONResponse(status_code=402, content=body)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def handle_http(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request through x402 payment middleware.
 
-        Args:
-            request: FastAPI/Starlette request
-            call_next: Next middleware/handler in chain
+        Sends a 402 response, or proceeds to the wrapped app once payment has
+        been verified and settled.
 
-        Returns:
-            Response (either 402 or proceeds to handler)
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
+        request = Request(scope)
         path = request.url.path
         method = request.method
 
@@ -242,14 +244,16 @@ class X402PaywallMiddleware(BaseHTTPMiddleware):
         # Skip payment check for excluded paths
         if self._should_skip_payment(path):
             logger.info(f"[x402] Skipping payment check for path: {path}")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Check if route is protected
         route_config = self._get_route_config(method, path)
         if not route_config:
             # Route not protected, proceed without payment check
             logger.info(f"[x402] Route not protected: {method} {path}")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         logger.info(f"[x402] Route protected: {method} {path}, Config: {route_config.description}")
 
@@ -270,7 +274,8 @@ class X402PaywallMiddleware(BaseHTTPMiddleware):
             for key, value in request.headers.items():
                 all_headers[key] = value
             logger.info(f"[x402] All header values: {all_headers}")
-            return self._create_payment_required_response(requirements)
+            await self._create_payment_required_response(requirements)(scope, receive, send)
+            return
         
         logger.info(f"[x402] ✓ Payment header found, verifying payment for {method} {path}")
         logger.info(f"[x402] Payment header length: {len(x_payment_header)}")
@@ -314,10 +319,11 @@ class X402PaywallMiddleware(BaseHTTPMiddleware):
             if not verify_result.get("isValid"):
                 invalid_reason = verify_result.get("invalidReason", "Invalid payment")
                 logger.error(f"[x402] ✗ Payment verification FAILED: {invalid_reason}")
-                return self._create_payment_required_response(
+                await self._create_payment_required_response(
                     requirements,
                     error=invalid_reason,
-                )
+                )(scope, receive, send)
+                return
             
             logger.info(f"[x402] ✓ Payment verified successfully, payer: {verify_result.get('payer')}")
 
@@ -342,44 +348,49 @@ class X402PaywallMiddleware(BaseHTTPMiddleware):
                 settle_error = settle_result.get("error", "Settlement failed")
                 logger.error(f"[x402] ✗ Payment settlement FAILED: {settle_error}")
                 logger.info(f"[x402] Full settlement result: {settle_result}")
-                return self._create_payment_required_response(
+                await self._create_payment_required_response(
                     requirements,
                     error=settle_error,
-                )
+                )(scope, receive, send)
+                return
 
             logger.info(f"[x402] ✓ Payment settled successfully")
             logger.info(f"[x402] Settlement result: {settle_result}")
-            
-            # Payment verified and settled, proceed to handler
-            logger.info(f"[x402] Proceeding to handler for {method} {path}")
-            response = await call_next(request)
-            logger.info(f"[x402] Handler response status: {response.status_code if hasattr(response, 'status_code') else 'N/A'}")
-
-            # Add X-PAYMENT-RESPONSE header with settlement result
-            if hasattr(response, "headers"):
-                import base64 as b64
-                response.headers["X-PAYMENT-RESPONSE"] = b64.b64encode(
-                    json.dumps(settle_result).encode("utf-8")
-                ).decode("utf-8")
-
-            return response
 
         except ValueError as e:
             # Invalid payment header format
             logger.error(f"[x402] ✗ Payment header decode error: {str(e)}", exc_info=True)
-            return self._create_payment_required_response(
+            await self._create_payment_required_response(
                 requirements, error=f"Invalid payment header: {str(e)}"
-            )
+            )(scope, receive, send)
+            return
         except Exception as e:
             # Payment verification error
             logger.error(f"[x402] ✗ Payment verification error: {str(e)}", exc_info=True)
             import traceback
             logger.error(f"[x402] Full traceback: {traceback.format_exc()}")
             # Return 402 with error details instead of 500
-            return self._create_payment_required_response(
+            await self._create_payment_required_response(
                 requirements,
                 error=f"Payment verification error: {str(e)}",
-            )
+            )(scope, receive, send)
+            return
+
+        # Payment verified and settled, proceed to handler and add the
+        # X-PAYMENT-RESPONSE header with the settlement result
+        logger.info(f"[x402] Proceeding to handler for {method} {path}")
+        payment_response = base64.b64encode(json.dumps(settle_result).encode("utf-8"))
+
+        async def send_with_payment_response(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                logger.info(f"[x402] Handler response status: {message['status']}")
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-payment-response", payment_response),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_payment_response)
 
 
 def x402Paywall(
@@ -388,7 +399,7 @@ def x402Paywall(
     facilitator_service: Optional[FacilitatorService] = None,
     facilitator_url: Optional[str] = None,
     skip_paths: Optional[list[str]] = None,
-) -> type[BaseHTTPMiddleware]:
+) -> type[X402PaywallMiddleware]:
     """Create x402Paywall middleware factory.
 
     This is a convenience function that returns a middleware class that can be
@@ -9,7 +9,7 @@ native MOV token and ERC-20 tokens.
 Reference: https://docs.movementnetwork.xyz/devs/indexing#defi-queries
 
 Usage:
-    python get_movement_balance.py <address> [--network NETWORK] [--indexer-url URL]
+    python get_movement_balance.py <address> [--network NETWORK] [--indexer-url URL] [--verbose] [--min-raw-amount N]
     
 Examples:
     # Get all token balances on mainnet
@@ -20,24 +20,33 @@ Examples:
     
     # Get balances with custom indexer URL
     python3 get_movement_balance.py 0x02d969ad6f7cca2c08226eda6ad8971ca99357ba9f192faed1c4186200b789fa --indexer-url https://indexer.mainnet.movementnetwork.xyz/v1/graphql
+    
+    # Skip dust balances (raw amount below 1000)
+    python get_movement_balance.py 0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb --min-raw-amount 1000
 """
 
 import argparse
-import json
+import copy
 import os
+import re
 import sys
-from typing import Dict, List, Optional
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional
 
 try:
-    import requests
-except ImportError:
+    import httpx
+    import orjson
+except ImportError as e:
     print(
-        "Error: 'requests' module not found. Please install dependencies:\n"
+        f"Error: '{e.name}' module not found. Please install dependencies:\n"
         "  python3 -m venv venv\n"
         "  source venv/bin/activate\n"
         "  pip install -e .\n"
-        "Or install requests directly:\n"
-        "  pip install requests"
+        "Or install them directly:\n"
+        "  pip install 'httpx[http2,brotli]' orjson"
     )
     sys.exit(1)
 
@@ -62,23 +71,161 @@ DEFAULT_INDEXER_PROVIDER = "sentio"  # Change this to switch default provider
 
 # Native token asset type (MOVE coin)
 NATIVE_TOKEN_ASSET_TYPE = "0x000000000000000000000000000000000000000000000000000000000000000a"
+NATIVE_TOKEN_ASSET_TYPE_LOWER = NATIVE_TOKEN_ASSET_TYPE.lower()
+
+# "0x" followed by at least one hex digit
+_ADDRESS_MATCH = re.compile(r"0x[0-9a-fA-F]+").fullmatch
+
+# Balances are formatted with this many decimal places
+DISPLAY_DECIMALS = 6
+_DISPLAY_SCALE = 10**DISPLAY_DECIMALS
+
+# Indexer request settings
+BATCH_SIZE = 1000  # Hasura default limit is usually 1000
+REQUEST_TIMEOUT_SECONDS = 30
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.3
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_PAGE_WORKERS = 8  # Concurrent page fetches after the first page
+
+# Opt-in in-memory cache of successful get_balances results for long-lived
+# callers (a one-shot CLI run never hits it), keyed by
+# (indexer_url, address, verbose, min_amount) -> (monotonic time fetched, result)
+# and kept in fetch order, so the first entry is always the oldest
+BALANCE_CACHE_TTL_SECONDS = 30
+BALANCE_CACHE_MAX_ENTRIES = 1024
+_balance_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+INDEXER_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "User-Agent": "Movement-Balance-Checker/1.0",
+    "Origin": "https://movementnetwork.xyz",
+    "Referer": "https://movementnetwork.xyz/",
+}
+
+# Shared HTTP/2 client so repeated indexer calls reuse (and multiplex over) one
+# pooled TLS connection. httpx builds Accept-Encoding from the decoders it can
+# use, so with the brotli extra installed it asks for "br" (much smaller for the
+# repetitive metadata JSON) and falls back to gzip/deflate otherwise.
+_HTTP = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        retries=MAX_RETRIES,  # connection failures only; status retries in post_indexer
+    ),
+    headers=INDEXER_HEADERS,
+    timeout=REQUEST_TIMEOUT_SECONDS,
+)
 
 # GraphQL query to get user token balances with pagination
-# Note: amount: {_gt: 0} filters out zero balances - only tokens with balance > 0
+# Note: amount: {_gt: 0} filters out zero balances - only tokens with balance > 0;
+# $minAmount optionally raises that floor to skip dust balances
+# The total row count is only requested with the first page ($withCount: true),
+# and last_transaction_timestamp only in verbose mode ($verbose: true)
+# Test tokens (see is_test_token) are excluded by the indexer itself, so they
+# are neither transferred nor counted when planning pages. Wrapping the
+# metadata predicate in _not keeps rows that have no metadata.
 GET_USER_BALANCES_QUERY = """
-query GetUserTokenBalances($ownerAddress: String!, $limit: Int, $offset: Int) {
+query GetUserTokenBalances(
+  $ownerAddress: String!,
+  $limit: Int,
+  $offset: Int,
+  $withCount: Boolean! = false,
+  $verbose: Boolean! = false,
+  $minAmount: numeric! = 0
+) {
+  current_fungible_asset_balances_aggregate(
+    where: {
+      owner_address: {_eq: $ownerAddress},
+      amount: {_gt: 0, _gte: $minAmount},
+      _not: {metadata: {name: {_ilike: "%test%"}}}
+    }
+  ) @include(if: $withCount) {
+    aggregate {
+      count
+    }
+  }
+  current_fungible_asset_balances(
+    where: {
+      owner_address: {_eq: $ownerAddress},
+      amount: {_gt: 0, _gte: $minAmount},
+      _not: {metadata: {name: {_ilike: "%test%"}}}
+    }
+    order_by: [{amount: desc}, {asset_type: asc}]
+    limit: $limit
+    offset: $offset
+  ) {
+    asset_type
+    amount
+    last_transaction_timestamp @include(if: $verbose)
+    metadata {
+      name
+      symbol
+      decimals
+    }
+  }
+}
+"""
+
+# Keyset variant: continues after the last (amount, asset_type) of the previous
+# page, so each page is an index range scan instead of scanning past an offset
+GET_USER_BALANCES_AFTER_QUERY = """
+query GetUserTokenBalancesAfter(
+  $ownerAddress: String!,
+  $limit: Int,
+  $lastAmount: numeric!,
+  $lastAssetType: String!,
+  $verbose: Boolean! = false,
+  $minAmount: numeric! = 0
+) {
+  current_fungible_asset_balances(
+    where: {
+      owner_address: {_eq: $ownerAddress},
+      amount: {_gt: 0, _gte: $minAmount},
+      _not: {metadata: {name: {_ilike: "%test%"}}},
+      _or: [
+        {amount: {_lt: $lastAmount}},
+        {amount: {_eq: $lastAmount}, asset_type: {_gt: $lastAssetType}}
+      ]
+    }
+    order_by: [{amount: desc}, {asset_type: asc}]
+    limit: $limit
+  ) {
+    asset_type
+    amount
+    last_transaction_timestamp @include(if: $verbose)
+    metadata {
+      name
+      symbol
+      decimals
+    }
+  }
+}
+"""
+
+# Fallback variants for endpoints that reject the aggregate or the metadata
+# predicate: no row count and no test-token filter, so test tokens are dropped
+# by build_balances_result instead
+GET_USER_BALANCES_PLAIN_QUERY = """
+query GetUserTokenBalancesPlain(
+  $ownerAddress: String!,
+  $limit: Int,
+  $offset: Int,
+  $verbose: Boolean! = false,
+  $minAmount: numeric! = 0
+) {
   current_fungible_asset_balances(
     where: {
       owner_address: {_eq: $ownerAddress},
-      amount: {_gt: 0}
+      amount: {_gt: 0, _gte: $minAmount}
     }
-    order_by: {amount: desc}
+    order_by: [{amount: desc}, {asset_type: asc}]
     limit: $limit
     offset: $offset
   ) {
     asset_type
     amount
-    last_transaction_timestamp
+    last_transaction_timestamp @include(if: $verbose)
     metadata {
       name
       symbol
@@ -88,12 +235,59 @@ query GetUserTokenBalances($ownerAddress: String!, $limit: Int, $offset: Int) {
 }
 """
 
+GET_USER_BALANCES_PLAIN_AFTER_QUERY = """
+query GetUserTokenBalancesPlainAfter(
+  $ownerAddress: String!,
+  $limit: Int,
+  $lastAmount: numeric!,
+  $lastAssetType: String!,
+  $verbose: Boolean! = false,
+  $minAmount: numeric! = 0
+) {
+  current_fungible_asset_balances(
+    where: {
+      owner_address: {_eq: $ownerAddress},
+      amount: {_gt: 0, _gte: $minAmount},
+      _or: [
+        {amount: {_lt: $lastAmount}},
+        {amount: {_eq: $lastAmount}, asset_type: {_gt: $lastAssetType}}
+      ]
+    }
+    order_by: [{amount: desc}, {asset_type: asc}]
+    limit: $limit
+  ) {
+    asset_type
+    amount
+    last_transaction_timestamp @include(if: $verbose)
+    metadata {
+      name
+      symbol
+      decimals
+    }
+  }
+}
+"""
+
+# Pre-encoded request body prefix; variables are appended per page
+_BALANCES_BODY_PREFIX = b'{"query":' + orjson.dumps(GET_USER_BALANCES_QUERY) + b',"variables":'
+_BALANCES_AFTER_BODY_PREFIX = (
+    b'{"query":' + orjson.dumps(GET_USER_BALANCES_AFTER_QUERY) + b',"variables":'
+)
+_BALANCES_PLAIN_BODY_PREFIX = (
+    b'{"query":' + orjson.dumps(GET_USER_BALANCES_PLAIN_QUERY) + b',"variables":'
+)
+_BALANCES_PLAIN_AFTER_BODY_PREFIX = (
+    b'{"query":' + orjson.dumps(GET_USER_BALANCES_PLAIN_AFTER_QUERY) + b',"variables":'
+)
+
 
+@lru_cache(maxsize=16)
 def get_indexer_url_by_provider(provider: str = "sentio") -> str:
     """Get Movement Indexer URL by provider name (mainnet only).
     
     To switch indexer providers, just change the 'provider' parameter.
     To add a new provider, add it to the INDEXER_PROVIDERS dictionary above.
+    Lookups are memoized per spelling of the provider name.
     
     Args:
         provider: Indexer provider name (e.g., "sentio", "official", etc.)
@@ -143,25 +337,23 @@ def get_indexer_url(custom_url: Optional[str] = None) -> str:
 def validate_address(address: str) -> bool:
     """Validate Ethereum/Movement address format.
     
+    A valid address is "0x" followed by one or more hexadecimal characters.
+    
     Args:
         address: Address to validate
         
     Returns:
         True if address is valid, False otherwise
     """
-    if not address.startswith("0x"):
-        return False
-    if len(address) < 3:
-        return False
-    hex_part = address[2:]
-    if not all(c in "0123456789abcdefABCDEF" for c in hex_part):
-        return False
-    return True
+    return _ADDRESS_MATCH(address) is not None
 
 
 def format_balance(amount: str, decimals: int = 18) -> str:
     """Format balance from string amount to human-readable format.
     
+    The amount is scaled with integer arithmetic and rounded half-even to six
+    places, so balances of any size are exact and never pass through float.
+    
     Args:
         amount: Balance as string (from GraphQL response)
         decimals: Number of decimals (default: 18)
@@ -170,11 +362,22 @@ def format_balance(amount: str, decimals: int = 18) -> str:
         Formatted balance string
     """
     try:
-        amount_int = int(amount)
-        balance = amount_int / (10 ** decimals)
-        return f"{balance:.6f}"
+        value = int(amount)
+        shift = decimals - DISPLAY_DECIMALS
     except (ValueError, TypeError):
         return amount
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    if shift > 0:
+        divisor = 10**shift
+        scaled, remainder = divmod(value, divisor)
+        # Round half to even
+        if 2 * remainder > divisor or (2 * remainder == divisor and scaled & 1):
+            scaled += 1
+    else:
+        scaled = value * 10**-shift
+    whole, fraction = divmod(scaled, _DISPLAY_SCALE)
+    return f"{sign}{whole}.{fraction:06d}"
 
 
 def parse_metadata(metadata: Optional[Dict]) -> Dict[str, str]:
@@ -186,120 +389,315 @@ def parse_metadata(metadata: Optional[Dict]) -> Dict[str, str]:
     Returns:
         Dictionary with parsed metadata fields
     """
-    if not metadata:
+    if not metadata or not isinstance(metadata, dict):
         return {}
-    result = {}
-    if isinstance(metadata, dict):
-        result["name"] = metadata.get("name", "Unknown")
-        result["symbol"] = metadata.get("symbol", "Unknown")
-        result["decimals"] = metadata.get("decimals", "18")
-    return result
+    return {
+        "name": metadata.get("name", "Unknown"),
+        "symbol": metadata.get("symbol", "Unknown"),
+        "decimals": metadata.get("decimals", "18"),
+    }
 
 
-def get_balances(indexer_url: str, address: str) -> Dict:
-    """Get all token balances for an address using Movement Indexer API with pagination.
+def is_test_token(balance: Dict) -> bool:
+    """Check if a token is a test token.
     
-    Fetches all tokens with balance > 0 by paginating through results.
-    Zero balance tokens are excluded.
+    Test tokens have "test" in their name. This matches what the explorer
+    does - it filters out test tokens. The symbol is not checked, so tickers
+    such as "tBTC" are kept.
+    
+    Args:
+        balance: Balance row from GraphQL response
+        
+    Returns:
+        True if the token looks like a test token, False otherwise
+    """
+    metadata = balance.get("metadata") or {}
+    return "test" in (metadata.get("name") or "").lower()
+
+
+def build_balances_body(
+    address: str,
+    offset: int,
+    with_count: bool = False,
+    verbose: bool = False,
+    min_amount: int = 0,
+    plain: bool = False,
+) -> bytes:
+    """Build the encoded GraphQL request body for one page of balances.
+    
+    Only the variables are encoded per call; the query part of the body is
+    encoded once at import time.
     
     Args:
-        indexer_url: Movement Indexer GraphQL endpoint URL
         address: Wallet address to check
+        offset: Pagination offset
+        with_count: Also request the total number of balance rows
+        verbose: Also request each balance's last transaction timestamp
+        min_amount: Skip balances below this raw amount
+        plain: Use the fallback query, without the row count or the
+            test-token filter (with_count is ignored)
         
     Returns:
-        Dictionary with balance information
+        JSON-encoded GraphQL payload
     """
+    variables = {
+        "ownerAddress": address,
+        "limit": BATCH_SIZE,
+        "offset": offset,
+        "verbose": verbose,
+    }
+    if min_amount:
+        # Sent as a string so amounts beyond 2**53 keep full precision
+        variables["minAmount"] = str(min_amount)
+    if plain:
+        return _BALANCES_PLAIN_BODY_PREFIX + orjson.dumps(variables) + b"}"
+    variables["withCount"] = with_count
+    return _BALANCES_BODY_PREFIX + orjson.dumps(variables) + b"}"
+
+
+def build_balances_after_body(
+    address: str,
+    last_amount: str,
+    last_asset_type: str,
+    verbose: bool = False,
+    min_amount: int = 0,
+    plain: bool = False,
+) -> bytes:
+    """Build the encoded keyset-pagination body for the page after a given row.
+    
+    Args:
+        address: Wallet address to check
+        last_amount: Amount of the last row of the previous page
+        last_asset_type: Asset type of the last row of the previous page
+        verbose: Also request each balance's last transaction timestamp
+        min_amount: Skip balances below this raw amount
+        plain: Use the fallback query, without the test-token filter
+        
+    Returns:
+        JSON-encoded GraphQL payload
+    """
+    variables = {
+        "ownerAddress": address,
+        "limit": BATCH_SIZE,
+        "lastAmount": last_amount,
+        "lastAssetType": last_asset_type,
+        "verbose": verbose,
+    }
+    if min_amount:
+        variables["minAmount"] = str(min_amount)
+    prefix = _BALANCES_PLAIN_AFTER_BODY_PREFIX if plain else _BALANCES_AFTER_BODY_PREFIX
+    return prefix + orjson.dumps(variables) + b"}"
+
+
+def post_indexer(indexer_url: str, body: bytes) -> httpx.Response:
+    """POST a GraphQL body to the indexer, retrying rate limits and server errors.
+    
+    Responses with a status in RETRY_STATUS_CODES are retried up to MAX_RETRIES
+    times with exponential backoff (0.3s, 0.6s, 1.2s).
+    
+    Args:
+        indexer_url: Movement Indexer GraphQL endpoint URL
+        body: Encoded GraphQL payload
+        
+    Returns:
+        The last indexer response
+    """
+    response = _HTTP.post(indexer_url, content=body)
+    for attempt in range(MAX_RETRIES):
+        if response.status_code not in RETRY_STATUS_CODES:
+            break
+        time.sleep(RETRY_BACKOFF_SECONDS * (2 ** attempt))
+        response = _HTTP.post(indexer_url, content=body)
+    return response
+
+
+class IndexerError(Exception):
+    """Raised when the indexer rejects a balances query (403 or GraphQL errors)."""
+
+
+class IndexerQueryError(IndexerError):
+    """Raised when the indexer answers a balances query with GraphQL errors."""
+
+
+def forbidden_error_detail(response) -> str:
+    """Build the error message for a 403 response from the indexer.
+    
+    Args:
+        response: httpx response
+        
+    Returns:
+        Error message including any details returned by the indexer
+    """
+    error_detail = "Forbidden - The indexer endpoint may require authentication or have access restrictions."
     try:
-        all_balances = []
-        offset = 0
-        batch_size = 1000  # Hasura default limit is usually 1000
+        error_data = orjson.loads(response.content)
+        if "errors" in error_data:
+            error_detail += f" Details: {orjson.dumps(error_data['errors']).decode()}"
+    except Exception:
+        error_detail += f" Response: {response.text[:200]}"
+    return error_detail
+
+
+def build_balances_result(address: str, balances: Iterable[Dict]) -> Dict:
+    """Filter test tokens, put the native token first, and build the success result.
+    
+    Rows are filtered as they are consumed, so test tokens are never collected
+    when balances is a generator such as iter_balances(). The indexer already
+    returns rows ordered by amount descending, so moving the native token to
+    the front in the same pass yields (native first, amount descending)
+    without sorting.
+    
+    Args:
+        address: Wallet address that was checked
+        balances: Balance rows fetched from the indexer, ordered by amount descending
         
-        while True:
-            variables = {
-                "ownerAddress": address,
-                "limit": batch_size,
-                "offset": offset
-            }
-            payload = {
-                "query": GET_USER_BALANCES_QUERY,
-                "variables": variables,
-            }
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "User-Agent": "Movement-Balance-Checker/1.0",
-                "Origin": "https://movementnetwork.xyz",
-                "Referer": "https://movementnetwork.xyz/",
-            }
-            response = requests.post(
-                indexer_url,
-                json=payload,
-                headers=headers,
-                timeout=30,
-            )
-            if response.status_code == 403:
-                error_detail = "Forbidden - The indexer endpoint may require authentication or have access restrictions."
-                try:
-                    error_data = response.json()
-                    if "errors" in error_data:
-                        error_detail += f" Details: {json.dumps(error_data['errors'])}"
-                except:
-                    error_detail += f" Response: {response.text[:200]}"
-                return {
-                    "address": address,
-                    "error": error_detail,
-                    "success": False,
-                }
-            response.raise_for_status()
-            data = response.json()
-            if "errors" in data:
-                return {
-                    "address": address,
-                    "error": f"GraphQL errors: {json.dumps(data['errors'])}",
-                    "success": False,
-                }
-            batch_balances = data.get("data", {}).get("current_fungible_asset_balances", [])
-            all_balances.extend(batch_balances)
-            
-            # If we got fewer results than requested, we've reached the end
-            if len(batch_balances) < batch_size:
-                break
-            
-            offset += batch_size
+    Returns:
+        Dictionary with balance information
+    """
+    # The main queries already exclude test tokens; this covers the plain
+    # fallback queries and any metadata the indexer's predicate matches differently
+    native_balances = []
+    other_balances = []
+    for balance in balances:
+        if is_test_token(balance):
+            continue
+        if balance.get("asset_type", "").lower() == NATIVE_TOKEN_ASSET_TYPE_LOWER:
+            native_balances.append(balance)
+        else:
+            other_balances.append(balance)
+    filtered_balances = native_balances + other_balances
+    return {
+        "address": address,
+        "balances": filtered_balances,
+        "success": True,
+        "total_fetched": len(filtered_balances),
+    }
+
+
+def fetch_balances_page(indexer_url: str, body: bytes) -> Dict:
+    """Fetch one page of token balances from the indexer.
+    
+    Args:
+        indexer_url: Movement Indexer GraphQL endpoint URL
+        body: Encoded GraphQL payload for the page
         
-        # Filter out test tokens (tokens with "test" in name or symbol starting with "t" followed by token name)
-        # This matches what the explorer does - it filters out test tokens
-        def is_test_token(balance: Dict) -> bool:
-            """Check if a token is a test token."""
-            metadata = balance.get("metadata", {})
-            name = metadata.get("name", "").lower()
-            symbol = metadata.get("symbol", "").lower()
-            # Test tokens typically have "test" in name or symbol like "tBTC", "tUSDT"
-            return "test" in name or (symbol.startswith("t") and len(symbol) > 1 and symbol[1:].isupper())
+    Returns:
+        The GraphQL "data" object for the page
         
-        # Filter out test tokens to match explorer behavior
-        filtered_balances = [b for b in all_balances if not is_test_token(b)]
+    Raises:
+        IndexerError: If the indexer returns 403 or GraphQL errors
+        httpx.HTTPError: On transport or HTTP errors
+    """
+    response = post_indexer(indexer_url, body)
+    if response.status_code == 403:
+        raise IndexerError(forbidden_error_detail(response))
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    if "errors" in data:
+        raise IndexerQueryError(f"GraphQL errors: {orjson.dumps(data['errors']).decode()}")
+    return data.get("data", {})
+
+
+def iter_balances(
+    indexer_url: str, address: str, verbose: bool = False, min_amount: int = 0
+) -> Iterator[Dict]:
+    """Yield token balances for an address page by page.
+    
+    The first page also returns the total row count; the remaining pages are
+    then fetched concurrently on the shared client and yielded in offset order.
+    Whenever the last page fetched is full (no count was reported, the query
+    was rejected and the first page retried with the plain fallback query, or
+    the count was stale), pages are then fetched one at a time with keyset
+    pagination on (amount, asset_type) until a short page comes back. Balances
+    below min_amount are excluded by the indexer, so the dust tail is never
+    paged through.
+    
+    Args:
+        indexer_url: Movement Indexer GraphQL endpoint URL
+        address: Wallet address to check
+        verbose: Also fetch each balance's last transaction timestamp
+        min_amount: Skip balances below this raw amount
         
-        # Sort balances to show native token first
-        def sort_key(balance: Dict) -> tuple:
-            """Sort key: native token first, then by amount descending."""
-            asset_type = balance.get("asset_type", "")
-            is_native = asset_type.lower() == NATIVE_TOKEN_ASSET_TYPE.lower()
-            amount = int(balance.get("amount", "0"))
-            # Return (is_native=False first, then by amount desc)
-            # So native token (True) comes before others (False)
-            return (not is_native, -amount)
+    Yields:
+        Balance rows, ordered by amount descending then asset type
         
-        filtered_balances.sort(key=sort_key)
+    Raises:
+        IndexerError: If the indexer returns 403 or GraphQL errors
+        httpx.HTTPError: On transport or HTTP errors
+    """
+    first_body = build_balances_body(
+        address, 0, with_count=True, verbose=verbose, min_amount=min_amount
+    )
+    plain = False
+    try:
+        first_page = fetch_balances_page(indexer_url, first_body)
+    except IndexerQueryError:
+        # Some endpoints do not expose aggregate fields or reject the metadata
+        # predicate; page with the plain queries from here on
+        plain = True
+        first_body = build_balances_body(
+            address, 0, verbose=verbose, min_amount=min_amount, plain=True
+        )
+        first_page = fetch_balances_page(indexer_url, first_body)
+    batch_balances = first_page.get("current_fungible_asset_balances", [])
+    yield from batch_balances
+    
+    # If we got fewer results than requested, we've reached the end
+    if len(batch_balances) < BATCH_SIZE:
+        return
+    
+    aggregate = first_page.get("current_fungible_asset_balances_aggregate") or {}
+    count = aggregate.get("aggregate", {}).get("count")
+    if count is not None:
+        # Offsets cannot be chained like keyset cursors, but they can be fetched
+        # concurrently once the total is known
+        offsets = range(BATCH_SIZE, count, BATCH_SIZE)
         
+        def fetch_offset(offset: int) -> Dict:
+            body = build_balances_body(address, offset, verbose=verbose, min_amount=min_amount)
+            return fetch_balances_page(indexer_url, body)
+        
+        if offsets:
+            with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(offsets))) as executor:
+                for page in executor.map(fetch_offset, offsets):
+                    batch_balances = page.get("current_fungible_asset_balances", [])
+                    yield from batch_balances
+    
+    # The count may be stale, so a full last page is always followed up
+    while len(batch_balances) == BATCH_SIZE:
+        last = batch_balances[-1]
+        body = build_balances_after_body(
+            address, last["amount"], last["asset_type"], verbose, min_amount, plain
+        )
+        page = fetch_balances_page(indexer_url, body)
+        batch_balances = page.get("current_fungible_asset_balances", [])
+        yield from batch_balances
+
+
+def fetch_balances(
+    indexer_url: str, address: str, verbose: bool = False, min_amount: int = 0
+) -> Dict:
+    """Fetch all token balances for an address from the indexer, bypassing the cache.
+    
+    Args:
+        indexer_url: Movement Indexer GraphQL endpoint URL
+        address: Wallet address to check
+        verbose: Also fetch each balance's last transaction timestamp
+        min_amount: Skip balances below this raw amount
+        
+    Returns:
+        Dictionary with balance information
+    """
+    try:
+        rows = iter_balances(indexer_url, address, verbose, min_amount)
+        return build_balances_result(address, rows)
+    except IndexerError as e:
         return {
             "address": address,
-            "balances": filtered_balances,
-            "success": True,
-            "total_fetched": len(filtered_balances),
-            "filtered_out": len(all_balances) - len(filtered_balances),
+            "error": str(e),
+            "success": False,
         }
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {
             "address": address,
             "error": f"Request error: {str(e)}",
@@ -313,6 +711,57 @@ def get_balances(indexer_url: str, address: str) -> Dict:
         }
 
 
+def get_balances(
+    indexer_url: str,
+    address: str,
+    verbose: bool = False,
+    use_cache: bool = False,
+    min_amount: int = 0,
+) -> Dict:
+    """Get all token balances for an address using Movement Indexer API with pagination.
+    
+    Fetches all tokens with balance > 0 by paginating through results.
+    Zero balance tokens are excluded. Requests go through the module-level
+    HTTP/2 client so the connection is reused across pages and calls.
+    With use_cache, successful results are cached in memory for
+    BALANCE_CACHE_TTL_SECONDS and each caller gets its own copy. Caching is
+    off by default so callers that must see fresh balances (e.g. right after
+    a transfer) never get a stale result.
+    
+    Args:
+        indexer_url: Movement Indexer GraphQL endpoint URL
+        address: Wallet address to check
+        verbose: Also fetch each balance's last transaction timestamp
+        use_cache: Serve a recent cached result if one exists, and cache this one
+        min_amount: Skip balances below this raw amount (0 keeps all non-zero balances)
+        
+    Returns:
+        Dictionary with balance information
+    """
+    if not use_cache:
+        return fetch_balances(indexer_url, address, verbose, min_amount)
+    
+    key = (indexer_url, address, verbose, min_amount)
+    now = time.monotonic()
+    cached = _balance_cache.get(key)
+    if cached is not None and now - cached[0] < BALANCE_CACHE_TTL_SECONDS:
+        return copy.deepcopy(cached[1])
+    
+    result = fetch_balances(indexer_url, address, verbose, min_amount)
+    if result["success"]:
+        # Re-insert refreshed keys at the end; when full, evict the oldest entry
+        _balance_cache.pop(key, None)
+        while len(_balance_cache) >= BALANCE_CACHE_MAX_ENTRIES:
+            _balance_cache.popitem(last=False)
+        _balance_cache[key] = (now, copy.deepcopy(result))
+    return result
+
+
+def clear_balance_cache() -> None:
+    """Drop all cached get_balances results so the next calls hit the indexer."""
+    _balance_cache.clear()
+
+
 def print_balance_result(result: Dict) -> None:
     """Print balance result in a formatted way.
     
@@ -323,18 +772,12 @@ def print_balance_result(result: Dict) -> None:
         print(f"Error: {result.get('error', 'Unknown error')}")
         sys.exit(1)
     balances = result.get("balances", [])
-    total_fetched = result.get("total_fetched", len(balances))
     if not balances:
         print(f"Address: {result['address']}")
         print("No balances found (all balances are 0)")
         return
     print(f"Address: {result['address']}")
     print(f"Found {len(balances)} token balance(s) (non-zero balances only)")
-    filtered_out = result.get("filtered_out", 0)
-    if filtered_out > 0:
-        print(f"Note: {filtered_out} test token(s) filtered out (matching explorer behavior)")
-    if total_fetched != len(balances) and filtered_out == 0:
-        print(f"Total fetched: {total_fetched}")
     print()
     for idx, balance in enumerate(balances, 1):
         asset_type = balance.get("asset_type", "Unknown")
@@ -355,8 +798,8 @@ def print_balance_result(result: Dict) -> None:
         print()
 
 
-def main() -> None:
-    """Main function to get balance on Movement blockchain."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Get balance on Movement blockchain using Indexer API",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -380,6 +823,18 @@ def main() -> None:
         default=None,
         help="Custom Movement Indexer GraphQL URL (overrides network setting)",
     )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Also fetch and show each token's last transaction timestamp",
+    )
+    parser.add_argument(
+        "--min-raw-amount",
+        type=int,
+        default=0,
+        help="Skip balances below this raw on-chain amount (default: 0, show all non-zero)",
+    )
     parser.add_argument(
         "--use-sentio",
         action="store_true",
@@ -390,7 +845,20 @@ def main() -> None:
         action="store_true",
         help="Force use of main Movement indexer (DEFAULT_INDEXER_MAINNET) even if it fails",
     )
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import so repeated main() calls (watch loops, library use) reuse it
+_PARSER = _build_parser()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main function to get balance on Movement blockchain.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    args = _PARSER.parse_args(argv)
     if not validate_address(args.address):
         print(f"Error: Invalid address format: {args.address}")
         print("Address must start with 0x and contain valid hexadecimal characters")
@@ -418,7 +886,12 @@ def main() -> None:
     
     print(f"Network: {network}")
     print()
-    result = get_balances(indexer_url, args.address)
+    result = get_balances(
+        indexer_url,
+        args.address,
+        verbose=args.verbose,
+        min_amount=args.min_raw_amount,
+    )
     
     # If main indexer failed and not forcing, suggest Sentio
     if not result.get("success") and not args.use_sentio and not args.force_main_indexer:
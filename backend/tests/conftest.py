@@ -0,0 +1,7 @@
+"""Shared pytest configuration for the backend tests."""
+
+import os
+import sys
+
+# Make the backend root importable (app package, get_movement_balance) once for every test module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,33 @@
+"""Unit tests for the ASGIMiddleware base class."""
+
+import asyncio
+from typing import Any, Dict, List
+
+from app.middleware.base import ASGIMiddleware
+
+
+class TestASGIMiddleware:
+    """Tests for ASGIMiddleware."""
+
+    def test_only_http_scopes_reach_handle_http(self) -> None:
+        """Test that lifespan and websocket scopes bypass handle_http."""
+        handled: List[str] = []
+        delegated: List[str] = []
+
+        async def app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+            delegated.append(scope["type"])
+
+        class RecordingMiddleware(ASGIMiddleware):
+            async def handle_http(self, scope: Any, receive: Any, send: Any) -> None:
+                handled.append(scope["type"])
+                await self.app(scope, receive, send)
+
+        middleware = RecordingMiddleware(app)
+
+        async def run() -> None:
+            for scope_type in ("lifespan", "websocket", "http"):
+                await middleware({"type": scope_type}, None, None)
+
+        asyncio.run(run())
+        assert handled == ["http"]
+        assert delegated == ["lifespan", "websocket", "http"]
@@ -0,0 +1,111 @@
+"""Unit tests for the pure-ASGI FastCORS middleware."""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.middleware.cors_asgi import FastCORS
+
+ORIGIN = b"http://localhost:3000"
+
+
+async def echo_app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+    """Minimal downstream app that returns a plain JSON body."""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def run_request(
+    method: str, headers: List[Tuple[bytes, bytes]], scope_type: str = "http"
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Run one request through FastCORS and return sent messages and whether the app ran."""
+    called = {"app": False}
+    sent: List[Dict[str, Any]] = []
+
+    async def app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        called["app"] = True
+        await echo_app(scope, receive, send)
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    scope = {"type": scope_type, "method": method, "path": "/balance/", "headers": headers}
+    asyncio.run(FastCORS(app)(scope, receive, send))
+    return sent, called["app"]
+
+
+def header(message: Dict[str, Any], name: bytes) -> Optional[bytes]:
+    """Get a header value from an http.response.start message."""
+    for key, value in message["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+class TestFastCORS:
+    """Tests for FastCORS middleware."""
+
+    def test_request_without_origin_passes_through(self) -> None:
+        """Test that requests without an Origin header are not modified."""
+        sent, called = run_request("GET", [])
+        assert called is True
+        assert header(sent[0], b"access-control-allow-origin") is None
+
+    def test_simple_request_adds_cors_headers(self) -> None:
+        """Test that simple requests get wildcard origin and credentials headers."""
+        sent, called = run_request("GET", [(b"origin", ORIGIN)])
+        assert called is True
+        assert header(sent[0], b"access-control-allow-origin") == b"*"
+        assert header(sent[0], b"access-control-allow-credentials") == b"true"
+        assert header(sent[0], b"content-type") == b"application/json"
+
+    def test_simple_request_with_cookie_echoes_origin(self) -> None:
+        """Test that credentialed requests get the request origin echoed back."""
+        sent, _ = run_request("POST", [(b"origin", ORIGIN), (b"cookie", b"a=b")])
+        assert header(sent[0], b"access-control-allow-origin") == ORIGIN
+        assert header(sent[0], b"vary") == b"Origin"
+
+    def test_preflight_answered_without_entering_app(self) -> None:
+        """Test that preflight requests are answered directly."""
+        sent, called = run_request(
+            "OPTIONS",
+            [
+                (b"origin", ORIGIN),
+                (b"access-control-request-method", b"POST"),
+                (b"access-control-request-headers", b"content-type,x-payment"),
+            ],
+        )
+        assert called is False
+        assert sent[0]["status"] == 200
+        assert header(sent[0], b"access-control-allow-origin") == ORIGIN
+        assert header(sent[0], b"access-control-allow-headers") == b"content-type,x-payment"
+        assert header(sent[0], b"access-control-allow-credentials") == b"true"
+        assert b"POST" in header(sent[0], b"access-control-allow-methods")
+        assert sent[1]["body"] == b"OK"
+
+    def test_preflight_rejects_unknown_method(self) -> None:
+        """Test that preflight requests for unsupported methods are rejected."""
+        sent, called = run_request(
+            "OPTIONS",
+            [(b"origin", ORIGIN), (b"access-control-request-method", b"TRACE")],
+        )
+        assert called is False
+        assert sent[0]["status"] == 400
+
+    def test_options_without_request_method_reaches_app(self) -> None:
+        """Test that a plain OPTIONS request is handled by the app."""
+        _, called = run_request("OPTIONS", [(b"origin", ORIGIN)])
+        assert called is True
+
+    def test_non_http_scope_passes_through(self) -> None:
+        """Test that non-HTTP scopes are delegated untouched."""
+        _, called = run_request("GET", [(b"origin", ORIGIN)], scope_type="websocket")
+        assert called is True
@@ -7,18 +7,17 @@ Tests all functions in the get_movement_balance module including:
 - validate_address
 - format_balance
 - parse_metadata
-- get_balances (using real Sentio API)
+- get_balances (using real Sentio API; marked integration)
 """
 
-import os
-import sys
-from unittest.mock import patch
+import json
+from typing import Dict, Optional
+from unittest.mock import MagicMock, patch
 
+import httpx
+import orjson
 import pytest
 
-# Add parent directory to path to import get_movement_balance
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from get_movement_balance import (
     get_indexer_url_by_provider,
     get_indexer_url,
@@ -26,11 +25,39 @@ from get_movement_balance import (
     format_balance,
     parse_metadata,
     get_balances,
+    build_balances_body,
+    build_balances_result,
+    clear_balance_cache,
+    iter_balances,
+    is_test_token,
+    post_indexer,
+    main,
+    GET_USER_BALANCES_QUERY,
+    GET_USER_BALANCES_AFTER_QUERY,
+    GET_USER_BALANCES_PLAIN_QUERY,
+    GET_USER_BALANCES_PLAIN_AFTER_QUERY,
     INDEXER_PROVIDERS,
     DEFAULT_INDEXER_PROVIDER,
     NATIVE_TOKEN_ASSET_TYPE,
 )
 
+# Indexer used by the real-API tests
+SENTIO_URL = get_indexer_url_by_provider("sentio")
+# Seconds to wait for the Sentio indexer before skipping the real-API tests
+SENTIO_PROBE_TIMEOUT_SECONDS = 2
+
+
+@pytest.fixture(scope="session")
+def sentio_reachable() -> None:
+    """Skip real-API tests once, quickly, when the Sentio indexer cannot be reached.
+
+    Any HTTP response counts as reachable; only connection errors and timeouts skip.
+    """
+    try:
+        httpx.head(SENTIO_URL, timeout=SENTIO_PROBE_TIMEOUT_SECONDS)
+    except httpx.TransportError as e:
+        pytest.skip(f"Sentio indexer unreachable: {e!r}")
+
 
 class TestGetIndexerUrlByProvider:
     """Tests for get_indexer_url_by_provider function."""
@@ -69,31 +96,32 @@ class TestGetIndexerUrlByProvider:
 class TestGetIndexerUrl:
     """Tests for get_indexer_url function."""
 
-    def test_custom_url_takes_precedence(self) -> None:
-        """Test that custom URL takes precedence over environment."""
-        custom_url = "https://custom-indexer.example.com/graphql"
-        url = get_indexer_url(custom_url=custom_url)
-        assert url == custom_url
-
-    @patch.dict(os.environ, {"MOVEMENT_INDEXER_URL": "https://env-indexer.example.com/graphql"})
-    def test_environment_variable_url(self) -> None:
-        """Test that environment variable URL is used when no custom URL."""
-        url = get_indexer_url()
-        assert url == "https://env-indexer.example.com/graphql"
-
-    @patch.dict(os.environ, {}, clear=True)
-    def test_default_provider_when_no_env_or_custom(self) -> None:
-        """Test that default provider is used when no env or custom URL."""
-        url = get_indexer_url()
-        assert url == INDEXER_PROVIDERS[DEFAULT_INDEXER_PROVIDER]
-
-    @patch.dict(os.environ, {"MOVEMENT_INDEXER_URL": "https://env-indexer.example.com/graphql"})
-    def test_custom_url_overrides_env(self) -> None:
-        """Test that custom URL overrides environment variable."""
-        custom_url = "https://custom-indexer.example.com/graphql"
-        url = get_indexer_url(custom_url=custom_url)
-        assert url == custom_url
-        assert url != os.getenv("MOVEMENT_INDEXER_URL")
+    CUSTOM_INDEXER_URL = "https://custom-indexer.example.com/graphql"
+    ENV_INDEXER_URL_VALUE = "https://env-indexer.example.com/graphql"
+
+    @pytest.mark.parametrize(
+        "env_url, custom_url, expected",
+        [
+            (None, CUSTOM_INDEXER_URL, CUSTOM_INDEXER_URL),
+            (ENV_INDEXER_URL_VALUE, None, ENV_INDEXER_URL_VALUE),
+            (None, None, INDEXER_PROVIDERS[DEFAULT_INDEXER_PROVIDER]),
+            (ENV_INDEXER_URL_VALUE, CUSTOM_INDEXER_URL, CUSTOM_INDEXER_URL),
+        ],
+        ids=["custom_url", "env_url", "default_provider", "custom_overrides_env"],
+    )
+    def test_url_precedence(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        env_url: Optional[str],
+        custom_url: Optional[str],
+        expected: str,
+    ) -> None:
+        """Test that custom URL beats MOVEMENT_INDEXER_URL, which beats the default provider."""
+        if env_url:
+            monkeypatch.setenv("MOVEMENT_INDEXER_URL", env_url)
+        else:
+            monkeypatch.delenv("MOVEMENT_INDEXER_URL", raising=False)
+        assert get_indexer_url(custom_url=custom_url) == expected
 
 
 class TestValidateAddress:
@@ -138,6 +166,15 @@ class TestValidateAddress:
         address = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEbG"
         assert validate_address(address) is False
 
+    def test_invalid_trailing_newline(self) -> None:
+        """Test address followed by a newline."""
+        assert validate_address("0xabc\n") is False
+
+    def test_invalid_non_hex_in_middle(self) -> None:
+        """Test address with separators or whitespace between hex digits."""
+        assert validate_address("0x742d_35Cc") is False
+        assert validate_address("0x742d 35Cc") is False
+
     def test_valid_uppercase_hex(self) -> None:
         """Test address with uppercase hexadecimal characters."""
         address = "0xABCDEF1234567890ABCDEF1234567890ABCDEF12"
@@ -181,6 +218,24 @@ class TestFormatBalance:
         result = format_balance(amount)
         assert result == "1000.000000"
 
+    def test_format_balance_exact_for_large_amount(self) -> None:
+        """Test that large 18-decimal balances keep exact digits."""
+        amount = "123456789012345678901234567890"
+        result = format_balance(amount)
+        assert result == "123456789012.345679"
+
+    def test_format_balance_rounds_half_to_even(self) -> None:
+        """Test that a tie at the seventh place rounds to the even digit."""
+        assert format_balance("1000000500000000000") == "1.000000"
+        assert format_balance("1000001500000000000") == "1.000002"
+        assert format_balance("1000000500000000001") == "1.000001"
+
+    def test_format_balance_exact_for_u256_amount(self) -> None:
+        """Test that amounts wider than u128 keep every integer digit."""
+        amount = str(2**256 - 1)
+        expected = "115792089237316195423570985008687907853269984665640564039457.584008"
+        assert format_balance(amount) == expected
+
     def test_format_balance_invalid_string(self) -> None:
         """Test formatting invalid string returns original."""
         amount = "invalid"
@@ -193,6 +248,11 @@ class TestFormatBalance:
         result = format_balance(amount)
         assert result == amount
 
+    @pytest.mark.parametrize("decimals", ["6", None])
+    def test_format_balance_non_int_decimals(self, decimals: Optional[str]) -> None:
+        """Test that non-integer decimals from metadata return the original amount."""
+        assert format_balance("1000000", decimals) == "1000000"
+
     def test_format_balance_zero(self) -> None:
         """Test formatting zero balance."""
         amount = "0"
@@ -242,16 +302,89 @@ class TestParseMetadata:
         assert result == {}
 
 
+class TestBuildBalancesBody:
+    """Tests for build_balances_body function."""
+
+    def test_build_balances_body_is_valid_json(self) -> None:
+        """Test that the pre-encoded body decodes to the full GraphQL payload."""
+        body = json.loads(build_balances_body("0xabc", 2000))
+        assert "current_fungible_asset_balances" in body["query"]
+        assert body["variables"] == {
+            "ownerAddress": "0xabc",
+            "limit": 1000,
+            "offset": 2000,
+            "withCount": False,
+            "verbose": False,
+        }
+
+
+class TestIsTestToken:
+    """Tests for is_test_token function."""
+
+    def test_test_in_name(self) -> None:
+        """Test that tokens with "test" in the name are test tokens."""
+        assert is_test_token({"metadata": {"name": "My Test Coin", "symbol": "MTC"}}) is True
+
+    def test_t_prefixed_ticker_symbol_is_kept(self) -> None:
+        """Test that the symbol alone never marks a test token."""
+        assert is_test_token({"metadata": {"name": "Bitcoin", "symbol": "tBTC"}}) is False
+        assert is_test_token({"metadata": {"name": "Tether", "symbol": "tUSDT"}}) is False
+
+    def test_regular_tokens(self) -> None:
+        """Test that regular tokens and missing metadata are not test tokens."""
+        assert is_test_token({"metadata": {"name": "Movement", "symbol": "MOVE"}}) is False
+        assert is_test_token({"metadata": {"name": "Token", "symbol": "tok"}}) is False
+        assert is_test_token({"metadata": None}) is False
+
+    @pytest.mark.parametrize("symbol", ["TEST", "testUSD", "xTEST", "tst"])
+    def test_symbol_containing_test_is_kept(self, symbol: str) -> None:
+        """Test that a real token whose symbol merely contains "test" is not dropped."""
+        metadata = {"name": "Quest Coin", "symbol": symbol}
+        row = {"asset_type": "0x1::coin", "amount": "7", "metadata": metadata}
+        assert is_test_token(row) is False
+        assert build_balances_result("0xabc", [row])["balances"] == [row]
+
+    def test_queries_exclude_test_tokens(self) -> None:
+        """Test that every balance query filters test tokens by name only on the indexer."""
+        predicate = '_not: {metadata: {name: {_ilike: "%test%"}}}'
+        assert GET_USER_BALANCES_QUERY.count(predicate) == 2
+        assert GET_USER_BALANCES_AFTER_QUERY.count(predicate) == 1
+        assert "symbol: {" not in GET_USER_BALANCES_QUERY + GET_USER_BALANCES_AFTER_QUERY
+
+
+class TestBuildBalancesResult:
+    """Tests for build_balances_result function."""
+
+    def test_native_first_then_indexer_order(self) -> None:
+        """Test that the native token moves to the front and test tokens are dropped."""
+        rows = [
+            {"asset_type": "0x1::a", "amount": "30", "metadata": {"name": "A", "symbol": "A"}},
+            {"asset_type": "0x1::t", "amount": "20", "metadata": {"name": "Test", "symbol": "T"}},
+            {"asset_type": NATIVE_TOKEN_ASSET_TYPE, "amount": "10", "metadata": {"symbol": "MOVE"}},
+            {"asset_type": "0x1::b", "amount": "5", "metadata": {"name": "B", "symbol": "B"}},
+        ]
+        result = build_balances_result("0xabc", iter(rows))
+        assert [b["amount"] for b in result["balances"]] == ["10", "30", "5"]
+        assert result["total_fetched"] == 3
+        assert "filtered_out" not in result
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("sentio_reachable")
 class TestGetBalances:
     """Tests for get_balances function using real Sentio API."""
 
     # Known test address with balances
     TEST_ADDRESS = "0xf11fa795cb64853023334bbf658b636e2e20e78faf014050610012e56bade7f6"
 
-    def test_get_balances_success_single_batch(self) -> None:
+    @pytest.fixture(scope="class")
+    def balances_result(self, sentio_reachable: None) -> Dict:
+        """Fetch balances for TEST_ADDRESS once and share them across the class."""
+        return get_balances(SENTIO_URL, self.TEST_ADDRESS)
+
+    def test_get_balances_success_single_batch(self, balances_result: Dict) -> None:
         """Test successful balance fetch with real API."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         assert result["success"] is True
         assert result["address"] == self.TEST_ADDRESS
         assert len(result["balances"]) > 0
@@ -261,10 +394,9 @@ class TestGetBalances:
             assert "amount" in balance
             assert "metadata" in balance
 
-    def test_get_balances_success_multiple_batches(self) -> None:
+    def test_get_balances_success_multiple_batches(self, balances_result: Dict) -> None:
         """Test successful balance fetch with pagination using real API."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         assert result["success"] is True
         # Verify pagination works (if address has many tokens)
         total_fetched = result.get("total_fetched", 0)
@@ -273,10 +405,9 @@ class TestGetBalances:
         # If there are many tokens, pagination should have worked
         assert total_fetched >= 0
 
-    def test_get_balances_filters_test_tokens(self) -> None:
+    def test_get_balances_filters_test_tokens(self, balances_result: Dict) -> None:
         """Test that test tokens are filtered out using real API."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         assert result["success"] is True
         balances = result.get("balances", [])
         # Check that no test tokens are in results
@@ -290,10 +421,9 @@ class TestGetBalances:
             if symbol.startswith("t") and len(symbol) > 1:
                 assert not symbol[1:].isupper(), f"Test token pattern found: {symbol}"
 
-    def test_get_balances_sorts_native_token_first(self) -> None:
+    def test_get_balances_sorts_native_token_first(self, balances_result: Dict) -> None:
         """Test that native token is sorted first using real API."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         assert result["success"] is True
         if len(result.get("balances", [])) > 0:
             first_balance = result["balances"][0]
@@ -304,37 +434,33 @@ class TestGetBalances:
 
     def test_get_balances_empty_balances(self) -> None:
         """Test handling of empty balance response using real API."""
-        sentio_url = get_indexer_url_by_provider("sentio")
         # Use a valid address that likely has no balances (all zeros)
         empty_address = "0x" + "0" * 64
-        result = get_balances(sentio_url, empty_address)
+        result = get_balances(SENTIO_URL, empty_address)
         assert result["success"] is True
         assert result["address"] == empty_address
         # May have zero balances, which is valid
         assert isinstance(result.get("balances", []), list)
         assert result.get("total_fetched", 0) >= 0
 
-    def test_get_balances_request_structure(self) -> None:
+    def test_get_balances_request_structure(self, balances_result: Dict) -> None:
         """Test that real API request succeeds and returns proper structure."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         # Verify the request was successful
         assert result["success"] is True
         # Verify response structure
         assert "address" in result
         assert "balances" in result
         assert "total_fetched" in result
-        assert "filtered_out" in result
         # Verify balances are properly structured
         for balance in result.get("balances", []):
             assert "asset_type" in balance
             assert "amount" in balance
             assert "metadata" in balance
 
-    def test_get_balances_query_works_with_real_api(self) -> None:
+    def test_get_balances_query_works_with_real_api(self, balances_result: Dict) -> None:
         """Test that query works correctly with real API."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         # If successful, the query was correctly formatted
         assert result["success"] is True
         assert result["address"] == self.TEST_ADDRESS
@@ -342,6 +468,8 @@ class TestGetBalances:
         assert isinstance(result.get("balances", []), list)
 
 
+@pytest.mark.integration
+@pytest.mark.usefixtures("sentio_reachable")
 class TestGetBalancesRealAPI:
     """Unit tests using real Sentio API.
 
@@ -352,19 +480,22 @@ class TestGetBalancesRealAPI:
     # Known test address with balances (from get_movement_balance.py test function)
     TEST_ADDRESS = "0xf11fa795cb64853023334bbf658b636e2e20e78faf014050610012e56bade7f6"
 
-    def test_get_balances_real_api_success(self) -> None:
+    @pytest.fixture(scope="class")
+    def balances_result(self, sentio_reachable: None) -> Dict:
+        """Fetch balances for TEST_ADDRESS once and share them across the class."""
+        return get_balances(SENTIO_URL, self.TEST_ADDRESS)
+
+    def test_get_balances_real_api_success(self, balances_result: Dict) -> None:
         """Test getting balances from real Sentio API."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         assert result["success"] is True
         assert result["address"] == self.TEST_ADDRESS
         assert "balances" in result
         assert isinstance(result["balances"], list)
 
-    def test_get_balances_real_api_has_balances(self) -> None:
+    def test_get_balances_real_api_has_balances(self, balances_result: Dict) -> None:
         """Test that real API returns balances for known address."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         assert result["success"] is True
         balances = result.get("balances", [])
         # Known address should have at least some balances
@@ -376,10 +507,9 @@ class TestGetBalancesRealAPI:
             assert "metadata" in balance
             assert isinstance(balance["metadata"], dict)
 
-    def test_get_balances_real_api_native_token_first(self) -> None:
+    def test_get_balances_real_api_native_token_first(self, balances_result: Dict) -> None:
         """Test that native token is sorted first in real API response."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         if result["success"] and len(result.get("balances", [])) > 0:
             first_balance = result["balances"][0]
             # If native token exists, it should be first
@@ -387,10 +517,9 @@ class TestGetBalancesRealAPI:
                 # Real API returns "MOVE" as the symbol, not "MOV"
                 assert first_balance["metadata"].get("symbol") in ["MOV", "MOVE"]
 
-    def test_get_balances_real_api_filters_test_tokens(self) -> None:
+    def test_get_balances_real_api_filters_test_tokens(self, balances_result: Dict) -> None:
         """Test that test tokens are filtered out in real API response."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         if result["success"]:
             balances = result.get("balances", [])
             # Check that no test tokens are in results
@@ -406,30 +535,27 @@ class TestGetBalancesRealAPI:
 
     def test_get_balances_real_api_empty_address(self) -> None:
         """Test real API with address that has no balances."""
-        sentio_url = get_indexer_url_by_provider("sentio")
         # Generate a valid 66-char address (all zeros)
         empty_address = "0x" + "0" * 64
-        result = get_balances(sentio_url, empty_address)
+        result = get_balances(SENTIO_URL, empty_address)
         # Should succeed even if no balances
         assert result["success"] is True
         assert result["address"] == empty_address
         # May have zero balances, which is valid
         assert isinstance(result.get("balances", []), list)
 
-    def test_get_balances_real_api_pagination(self) -> None:
+    def test_get_balances_real_api_pagination(self, balances_result: Dict) -> None:
         """Test that pagination works with real API (if address has many tokens)."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         if result["success"]:
             total_fetched = result.get("total_fetched", 0)
             balances = result.get("balances", [])
             # Total fetched should match actual balances count
             assert total_fetched == len(balances)
 
-    def test_get_balances_real_api_metadata_structure(self) -> None:
+    def test_get_balances_real_api_metadata_structure(self, balances_result: Dict) -> None:
         """Test that real API returns properly structured metadata."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         if result["success"] and len(result.get("balances", [])) > 0:
             for balance in result["balances"]:
                 metadata = balance.get("metadata", {})
@@ -438,13 +564,242 @@ class TestGetBalancesRealAPI:
                 assert "symbol" in metadata or metadata.get("symbol") is not None
                 assert "decimals" in metadata or metadata.get("decimals") is not None
 
-    def test_get_balances_real_api_response_structure(self) -> None:
+    def test_get_balances_real_api_response_structure(self, balances_result: Dict) -> None:
         """Test that real API response has correct structure."""
-        sentio_url = get_indexer_url_by_provider("sentio")
-        result = get_balances(sentio_url, self.TEST_ADDRESS)
+        result = balances_result
         assert "address" in result
         assert "success" in result
         assert "balances" in result
         if result["success"]:
             assert "total_fetched" in result
-            assert "filtered_out" in result
+
+
+class TestIterBalances:
+    """Tests for iter_balances pagination using a mocked HTTP client."""
+
+    @staticmethod
+    def _page(rows: list, count: Optional[int] = None) -> MagicMock:
+        """Build an indexer response, with the aggregate count when one is given.
+
+        The count uses the shape GET_USER_BALANCES_QUERY selects:
+        current_fungible_asset_balances_aggregate { aggregate { count } }.
+        """
+        data: Dict = {"current_fungible_asset_balances": rows}
+        if count is not None:
+            data["current_fungible_asset_balances_aggregate"] = {"aggregate": {"count": count}}
+        response = MagicMock(status_code=200)
+        response.content = orjson.dumps({"data": data})
+        return response
+
+    def test_keyset_pages_without_count(self) -> None:
+        """Test keyset paging after the last row when the indexer reports no count."""
+        pages = [
+            self._page(
+                [{"amount": "3", "asset_type": "0x1"}, {"amount": "2", "asset_type": "0x2"}]
+            ),
+            self._page([{"amount": "1", "asset_type": "0x3"}]),
+        ]
+        with patch("get_movement_balance.BATCH_SIZE", 2), patch(
+            "get_movement_balance._HTTP.post", side_effect=pages
+        ) as post:
+            rows = iter_balances("https://indexer.test", "0xabc")
+            assert next(rows)["amount"] == "3"
+            assert post.call_count == 1
+            assert [row["amount"] for row in rows] == ["2", "1"]
+            assert post.call_count == 2
+        variables = orjson.loads(post.call_args.kwargs["content"])["variables"]
+        assert variables["lastAmount"] == "2"
+        assert variables["lastAssetType"] == "0x2"
+        assert "offset" not in variables
+
+    def test_retries_without_count_when_aggregate_rejected(self) -> None:
+        """Test that a rejected query falls back to the plain queries and keyset paging."""
+        sent = []
+        queries = []
+
+        def post(url: str, content: bytes) -> MagicMock:
+            body = orjson.loads(content)
+            variables = body["variables"]
+            sent.append(variables)
+            queries.append(body["query"])
+            if variables.get("withCount"):
+                error = {"message": "field 'current_fungible_asset_balances_aggregate' not found"}
+                response = MagicMock(status_code=200)
+                response.content = orjson.dumps({"errors": [error]})
+                return response
+            if "lastAmount" in variables:
+                return self._page([{"amount": "1", "asset_type": "0x3"}])
+            return self._page(
+                [{"amount": "3", "asset_type": "0x1"}, {"amount": "2", "asset_type": "0x2"}]
+            )
+
+        with patch("get_movement_balance.BATCH_SIZE", 2), patch(
+            "get_movement_balance._HTTP.post", side_effect=post
+        ):
+            amounts = [row["amount"] for row in iter_balances("https://indexer.test", "0xabc")]
+        assert amounts == ["3", "2", "1"]
+        assert [variables.get("withCount") for variables in sent] == [True, None, None]
+        assert sent[2]["lastAmount"] == "2"
+        assert [query.split("(")[0].split()[-1] for query in queries] == [
+            "GetUserTokenBalances",
+            "GetUserTokenBalancesPlain",
+            "GetUserTokenBalancesPlainAfter",
+        ]
+
+    def test_plain_queries_have_no_aggregate_or_metadata_predicate(self) -> None:
+        """Test that the fallback queries drop everything the main query may be rejected for."""
+        for query in (GET_USER_BALANCES_PLAIN_QUERY, GET_USER_BALANCES_PLAIN_AFTER_QUERY):
+            assert "_aggregate" not in query
+            assert "withCount" not in query
+            assert "_ilike" not in query
+
+    def test_fetches_remaining_pages_concurrently_in_order(self) -> None:
+        """Test that pages after the first are fetched from the reported count, in order."""
+        rows = [{"amount": str(amount)} for amount in range(5, 0, -1)]
+
+        def post(url: str, content: bytes) -> MagicMock:
+            variables = orjson.loads(content)["variables"]
+            offset = variables["offset"]
+            return self._page(rows[offset : offset + 2], 5 if variables["withCount"] else None)
+
+        with patch("get_movement_balance.BATCH_SIZE", 2), patch(
+            "get_movement_balance._HTTP.post", side_effect=post
+        ) as mock_post:
+            amounts = [row["amount"] for row in iter_balances("https://indexer.test", "0xabc")]
+        assert amounts == ["5", "4", "3", "2", "1"]
+        assert mock_post.call_count == 3
+
+    def test_keyset_pages_past_stale_count(self) -> None:
+        """Test that rows beyond a too-low count are still fetched after a full last page."""
+        rows = [{"amount": str(amount), "asset_type": f"0x{amount}"} for amount in range(6, 0, -1)]
+
+        def post(url: str, content: bytes) -> MagicMock:
+            variables = orjson.loads(content)["variables"]
+            if "lastAmount" in variables:
+                start = next(
+                    index + 1
+                    for index, row in enumerate(rows)
+                    if row["amount"] == variables["lastAmount"]
+                )
+                return self._page(rows[start : start + 2])
+            offset = variables["offset"]
+            return self._page(rows[offset : offset + 2], 3 if variables["withCount"] else None)
+
+        with patch("get_movement_balance.BATCH_SIZE", 2), patch(
+            "get_movement_balance._HTTP.post", side_effect=post
+        ) as mock_post:
+            amounts = [row["amount"] for row in iter_balances("https://indexer.test", "0xabc")]
+        assert amounts == ["6", "5", "4", "3", "2", "1"]
+        assert mock_post.call_count == 4
+
+    def test_min_amount_sent_with_every_page(self) -> None:
+        """Test that the dust floor is applied to the count and to every page query."""
+        sent = []
+
+        def post(url: str, content: bytes) -> MagicMock:
+            variables = orjson.loads(content)["variables"]
+            sent.append(variables)
+            if "lastAmount" in variables:
+                return self._page([{"amount": "7", "asset_type": "0x7"}])
+            rows = [{"amount": "9", "asset_type": "0x9"}, {"amount": "8", "asset_type": "0x8"}]
+            return self._page(rows, 4 if variables["withCount"] else None)
+
+        with patch("get_movement_balance.BATCH_SIZE", 2), patch(
+            "get_movement_balance._HTTP.post", side_effect=post
+        ):
+            list(iter_balances("https://indexer.test", "0xabc", min_amount=10**20))
+        assert [variables["minAmount"] for variables in sent] == ["100000000000000000000"] * 3
+
+    def test_post_indexer_retries_server_errors(self) -> None:
+        """Test that 5xx responses are retried with backoff until success."""
+        responses = [MagicMock(status_code=503), MagicMock(status_code=200)]
+        with patch("get_movement_balance._HTTP.post", side_effect=responses) as post, patch(
+            "get_movement_balance.time.sleep"
+        ) as sleep:
+            response = post_indexer("https://indexer.test", b"{}")
+        assert response.status_code == 200
+        assert post.call_count == 2
+        sleep.assert_called_once_with(0.3)
+
+
+class TestBalanceCache:
+    """Tests for the in-memory get_balances cache."""
+
+    def test_repeat_calls_served_from_cache(self) -> None:
+        """Test that a second cached call within the TTL does not hit the indexer."""
+        rows = [{"asset_type": "0x1::coin", "amount": "1", "metadata": {"name": "Coin"}}]
+        with patch("get_movement_balance.iter_balances", return_value=rows) as fetch:
+            first = get_balances("https://cache.test", "0xcache", use_cache=True)
+            second = get_balances("https://cache.test", "0xcache", use_cache=True)
+            assert second == first
+            assert fetch.call_count == 1
+            get_balances("https://cache.test", "0xcache", use_cache=False)
+            assert fetch.call_count == 2
+
+    def test_cache_is_opt_in(self) -> None:
+        """Test that calls without use_cache always hit the indexer."""
+        rows = [{"asset_type": "0x1::coin", "amount": "1", "metadata": {"name": "Coin"}}]
+        with patch("get_movement_balance.iter_balances", return_value=rows) as fetch:
+            get_balances("https://cache.test", "0xoptin")
+            get_balances("https://cache.test", "0xoptin")
+            assert fetch.call_count == 2
+
+    def test_cached_results_are_copies(self) -> None:
+        """Test that mutating a returned result does not change later cache hits."""
+        rows = [{"asset_type": "0x1::coin", "amount": "1", "metadata": {"name": "Coin"}}]
+        with patch("get_movement_balance.iter_balances", return_value=rows):
+            first = get_balances("https://cache.test", "0xcopy", use_cache=True)
+            first["balances"][0]["amount"] = "999"
+            first["balances"].clear()
+            second = get_balances("https://cache.test", "0xcopy", use_cache=True)
+            second["balances"][0]["metadata"]["name"] = "Mutated"
+            third = get_balances("https://cache.test", "0xcopy", use_cache=True)
+        assert second["balances"][0]["amount"] == "1"
+        assert third["balances"][0]["metadata"]["name"] == "Coin"
+
+    def test_full_cache_evicts_only_the_oldest_entry(self) -> None:
+        """Test that inserting into a full cache drops the oldest entry and keeps the rest."""
+        rows = [{"asset_type": "0x1::coin", "amount": "1", "metadata": {"name": "Coin"}}]
+        clear_balance_cache()
+        with patch("get_movement_balance.BALANCE_CACHE_MAX_ENTRIES", 2), patch(
+            "get_movement_balance.iter_balances", return_value=rows
+        ) as fetch:
+            for address in ("0xold", "0xmid", "0xnew"):
+                get_balances("https://cache.test", address, use_cache=True)
+            assert fetch.call_count == 3
+            get_balances("https://cache.test", "0xmid", use_cache=True)
+            get_balances("https://cache.test", "0xnew", use_cache=True)
+            assert fetch.call_count == 3
+            get_balances("https://cache.test", "0xold", use_cache=True)
+            assert fetch.call_count == 4
+        clear_balance_cache()
+
+    def test_clear_balance_cache(self) -> None:
+        """Test that clearing the cache forces the next call to refetch."""
+        rows = [{"asset_type": "0x1::coin", "amount": "1", "metadata": {"name": "Coin"}}]
+        with patch("get_movement_balance.iter_balances", return_value=rows) as fetch:
+            get_balances("https://cache.test", "0xclear", use_cache=True)
+            clear_balance_cache()
+            get_balances("https://cache.test", "0xclear", use_cache=True)
+            assert fetch.call_count == 2
+
+
+class TestMain:
+    """Tests for the command-line entry point."""
+
+    def test_main_accepts_argv(self) -> None:
+        """Test that main parses an explicit argv with the shared parser."""
+        result = {
+            "address": "0xabc",
+            "balances": [],
+            "success": True,
+            "total_fetched": 0,
+        }
+        with patch("get_movement_balance.get_balances", return_value=result) as fetch, patch(
+            "get_movement_balance.print_balance_result"
+        ):
+            main(["0xabc", "--indexer-url", "https://cli.test"])
+            main(["0xdef", "--indexer-url", "https://cli.test", "-v"])
+        assert fetch.call_args_list[0].args == ("https://cli.test", "0xabc")
+        assert fetch.call_args_list[0].kwargs == {"verbose": False, "min_amount": 0}
+        assert fetch.call_args_list[1].kwargs == {"verbose": True, "min_amount": 0}
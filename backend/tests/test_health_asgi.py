@@ -0,0 +1,62 @@
+"""Unit tests for the pure-ASGI HealthASGIApp wrapper."""
+
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+from app.middleware.health_asgi import HealthASGIApp
+
+HEALTH_BODY = b'{"status":"healthy"}'
+
+
+def run_request(method: str, path: str) -> Tuple[List[Dict[str, Any]], bool]:
+    """Run one request through HealthASGIApp and return sent messages and whether the app ran."""
+    called = {"app": False}
+    sent: List[Dict[str, Any]] = []
+
+    async def app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        called["app"] = True
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    asyncio.run(HealthASGIApp(app, body=HEALTH_BODY)(scope, receive, send))
+    return sent, called["app"]
+
+
+class TestHealthASGIApp:
+    """Tests for HealthASGIApp."""
+
+    def test_health_served_without_entering_app(self) -> None:
+        """Test that GET /health returns the prebuilt body directly."""
+        sent, called = run_request("GET", "/health")
+        assert called is False
+        assert sent[0]["status"] == 200
+        assert (b"content-type", b"application/json") in sent[0]["headers"]
+        assert (b"content-length", str(len(HEALTH_BODY)).encode()) in sent[0]["headers"]
+        assert sent[1]["body"] == HEALTH_BODY
+
+    def test_head_served_without_body(self) -> None:
+        """Test that HEAD /health returns the GET headers with an empty body."""
+        sent, called = run_request("HEAD", "/health")
+        assert called is False
+        assert sent[0]["status"] == 200
+        assert (b"content-length", str(len(HEALTH_BODY)).encode()) in sent[0]["headers"]
+        assert sent[1]["body"] == b""
+
+    def test_start_message_not_shared_between_requests(self) -> None:
+        """Test that each response gets its own header list for outer middleware to rewrite."""
+        first, _ = run_request("GET", "/health")
+        second, _ = run_request("GET", "/health")
+        assert first[0]["headers"] == second[0]["headers"]
+        assert first[0]["headers"] is not second[0]["headers"]
+
+    def test_other_requests_delegate_to_app(self) -> None:
+        """Test that other paths and methods reach the wrapped app."""
+        for method, path in (("GET", "/balance/"), ("POST", "/health")):
+            sent, called = run_request(method, path)
+            assert called is True
+            assert sent == []
@@ -0,0 +1,84 @@
+"""Unit tests for the LazyAgentMount ASGI wrapper."""
+
+import asyncio
+import threading
+from typing import Any, Dict, List
+
+import pytest
+
+from app.middleware.lazy_mount import LazyAgentMount
+
+
+class TestLazyAgentMount:
+    """Tests for LazyAgentMount."""
+
+    def test_app_built_once_on_first_request(self) -> None:
+        """Test that the factory runs once, on the first request only."""
+        builds: List[int] = []
+        served: List[str] = []
+
+        async def agent_app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+            served.append(scope["path"])
+
+        def factory() -> Any:
+            builds.append(threading.get_ident())
+            return agent_app
+
+        mount = LazyAgentMount(factory)
+        assert mount.is_built is False
+
+        async def run() -> None:
+            await asyncio.gather(
+                *(mount({"type": "http", "path": f"/{i}"}, None, None) for i in range(5))
+            )
+
+        asyncio.run(run())
+        assert len(builds) == 1
+        assert builds[0] != threading.get_ident()
+        assert mount.is_built is True
+        assert sorted(served) == ["/0", "/1", "/2", "/3", "/4"]
+
+    def test_warm_builds_mounts_concurrently(self) -> None:
+        """Test that warm() builds each app once, off the event loop."""
+        builds: List[str] = []
+
+        async def agent_app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+            pass
+
+        def make_factory(name: str) -> Any:
+            def factory() -> Any:
+                builds.append(name)
+                return agent_app
+
+            return factory
+
+        mounts = [LazyAgentMount(make_factory(name)) for name in ("a", "b", "c")]
+
+        async def run() -> None:
+            await asyncio.gather(*(mount.warm() for mount in mounts))
+            await asyncio.gather(*(mount.warm() for mount in mounts))
+
+        asyncio.run(run())
+        assert sorted(builds) == ["a", "b", "c"]
+        assert all(mount.is_built for mount in mounts)
+
+    def test_failed_build_is_not_retried(self) -> None:
+        """Test that a factory error is raised once and reported on later requests."""
+        builds: List[int] = []
+
+        def factory() -> Any:
+            builds.append(1)
+            raise ValueError("MOVEMENT_PAY_TO environment variable is required")
+
+        mount = LazyAgentMount(factory, name="/sentiment")
+
+        async def run() -> None:
+            with pytest.raises(ValueError):
+                await mount({"type": "http", "path": "/"}, None, None)
+            with pytest.raises(RuntimeError, match="/sentiment app failed to build") as info:
+                await mount({"type": "http", "path": "/"}, None, None)
+            assert isinstance(info.value.__cause__, ValueError)
+
+        asyncio.run(run())
+        assert len(builds) == 1
+        assert mount.is_built is False
@@ -0,0 +1,63 @@
+"""Unit tests for the transfer agent's direct (no-LLM) command path."""
+
+import pytest
+
+from app.agents.transfer.agent import run_transfer_fast_path
+
+RECIPIENT = "0x" + "ab" * 32
+SENDER = "0x" + "cd" * 32
+
+
+class TestRunTransferFastPath:
+    """Tests for run_transfer_fast_path."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            f"send 5 MOVE to {RECIPIENT}",
+            f"Transfer 1.5 USDC.e to {RECIPIENT}",
+            f"  send 5 MOVE to {RECIPIENT}.  ",
+            f"send 0.25 weth.e to {RECIPIENT}",
+        ],
+    )
+    def test_bare_command_is_executed(self, query: str) -> None:
+        """Test that a bare imperative command is executed without the agent."""
+        output = run_transfer_fast_path(query)
+        assert output is not None
+        assert "Transaction hash:" in output
+        assert RECIPIENT[:10] in output
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            f"how much would it cost to send 5 MOVE to {RECIPIENT}?",
+            f"send 5 MOVE to {RECIPIENT}?",
+            f"don't transfer 5 MOVE to {RECIPIENT}",
+            f"do not send 5 MOVE to {RECIPIENT}",
+            f"estimate the fees to send 5 MOVE to {RECIPIENT}",
+            f"send 5 MOVE to {RECIPIENT} from {SENDER}",
+            f"from {SENDER} send 5 MOVE to {RECIPIENT}",
+            f"send 5 MOVE to {RECIPIENT} and then check the status",
+            f"send 5 tokens to {RECIPIENT}",
+            f"send 5 it to {RECIPIENT}",
+            f"transfer 5 USDC to {RECIPIENT}",
+            f"send 5 DOGE to {RECIPIENT}",
+        ],
+        ids=[
+            "question",
+            "question-mark",
+            "negation-dont",
+            "negation-do-not",
+            "estimate",
+            "sender-suffix",
+            "sender-prefix",
+            "extra-clause",
+            "unknown-symbol-tokens",
+            "unknown-symbol-it",
+            "unknown-symbol-unbridged",
+            "unknown-symbol-unlisted",
+        ],
+    )
+    def test_anything_else_falls_back_to_agent(self, query: str) -> None:
+        """Test that queries beyond the bare command are left to the LLM agent."""
+        assert run_transfer_fast_path(query) is None